@@ -68,7 +68,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 
-def get_password_hash(password: str) -> str:
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
     """
     Hash a plain text password for secure storage
     
@@ -82,6 +82,8 @@ def get_password_hash(password: str) -> str:
     
     Args:
         password (str): Plain text password to hash
+        rounds (Optional[int]): Bcrypt cost factor; None uses bcrypt's default (12).
+            Only lower it for throwaway seed/test data.
         
     Returns:
         str: Securely hashed password ready for database storage
@@ -104,7 +106,7 @@ def get_password_hash(password: str) -> str:
         password_bytes = password_bytes[:72]
     
     # Generate a random salt and hash the password
-    salt = bcrypt.gensalt()  # Creates a random salt for this password
+    salt = bcrypt.gensalt() if rounds is None else bcrypt.gensalt(rounds=rounds)  # Creates a random salt for this password
     hashed = bcrypt.hashpw(password_bytes, salt)
     
     return hashed.decode('utf-8')  # Convert back to string for database storage
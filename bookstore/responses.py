@@ -0,0 +1,22 @@
+"""
+Response classes for BookStore API
+"""
+
+from typing import Any
+from fastapi.responses import JSONResponse
+
+
+class SerializedJSONResponse(JSONResponse):
+    """
+    JSON response for bodies that are already serialized
+    
+    List endpoints build their body with the response model's own TypeAdapter
+    (see schemas.dump_list_json), so the bytes are sent as they are instead of
+    being validated and encoded a second time. Other content is encoded like a
+    regular JSONResponse.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
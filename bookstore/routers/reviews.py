@@ -8,13 +8,17 @@ from sqlalchemy.orm import Session, joinedload
 
 from ..database import get_db
 from ..models import Review, Book, User as UserModel
-from ..schemas import Review as ReviewSchema, ReviewCreate, ReviewUpdate
+from ..schemas import (
+    Review as ReviewSchema, ReviewCreate, ReviewUpdate,
+    REVIEW_LIST_ADAPTER, dump_list_json
+)
 from ..auth import get_current_active_user
+from ..responses import SerializedJSONResponse
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[ReviewSchema])
+@router.get("/", response_model=List[ReviewSchema], response_class=SerializedJSONResponse)
 async def get_reviews(
     book_id: int = None,
     user_id: int = None,
@@ -33,7 +37,7 @@ async def get_reviews(
         query = query.filter(Review.user_id == user_id)
     
     reviews = query.all()
-    return reviews
+    return SerializedJSONResponse(dump_list_json(REVIEW_LIST_ADAPTER, reviews))
 
 
 @router.get("/{review_id}", response_model=ReviewSchema)
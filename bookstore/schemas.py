@@ -2,24 +2,61 @@
 Pydantic schemas for data validation
 """
 
-from pydantic import BaseModel, EmailStr, Field
-from typing import List, Optional, Union
-from datetime import datetime
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, computed_field, field_serializer
+from typing import List, Literal, Optional, Union
+from datetime import datetime, timezone
 from enum import Enum
 
 
+# Supported book language codes (a closed set validates as a single hash lookup)
+Language = Literal["ru", "en", "fr", "de", "es", "it", "pt", "zh", "ja", "ko"]
+
+# Shared field constraints, built once and reused by base/update schemas
+USERNAME_FIELD = Field(..., min_length=3, max_length=50)
+USERNAME_OPT = Field(None, min_length=3, max_length=50)
+NAME_FIELD = Field(..., min_length=1, max_length=255)
+NAME_OPT = Field(None, min_length=1, max_length=255)
+GENRE_NAME_FIELD = Field(..., min_length=1, max_length=100)
+GENRE_NAME_OPT = Field(None, min_length=1, max_length=100)
+TITLE_FIELD = Field(..., min_length=1, max_length=500)
+TITLE_OPT = Field(None, min_length=1, max_length=500)
+ISBN_OPT = Field(None, max_length=20)
+PAGE_COUNT_OPT = Field(None, gt=0)
+PRICE_OPT = Field(None, ge=0)
+COVER_URL_OPT = Field(None, max_length=500)
+RATING_FIELD = Field(..., ge=1, le=5)
+RATING_OPT = Field(None, ge=1, le=5)
+
+
+def to_epoch(value: Optional[datetime]) -> Optional[int]:
+    """Convert datetime to Unix seconds for the wire format
+    
+    The database stores naive datetimes in UTC, so naive values are read as UTC
+    rather than as the server's local time.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
 # Base schemas
 class TimestampMixin(BaseModel):
-    """Mixin for timestamps"""
+    """Mixin for timestamps (serialized as Unix seconds)"""
     created_at: datetime
     updated_at: Optional[datetime] = None
+    
+    @field_serializer("created_at", "updated_at")
+    def serialize_timestamp(self, value: Optional[datetime]) -> Optional[int]:
+        return to_epoch(value)
 
 
 # Users
 class UserBase(BaseModel):
     """Base user schema"""
     email: EmailStr
-    username: str = Field(..., min_length=3, max_length=50)
+    username: str = USERNAME_FIELD
     full_name: Optional[str] = Field(None, max_length=255)
     is_active: bool = True
 
@@ -32,7 +69,7 @@ class UserCreate(UserBase):
 class UserUpdate(BaseModel):
     """Schema for user update"""
     email: Optional[EmailStr] = None
-    username: Optional[str] = Field(None, min_length=3, max_length=50)
+    username: Optional[str] = USERNAME_OPT
     full_name: Optional[str] = Field(None, max_length=255)
     is_active: Optional[bool] = None
 
@@ -54,7 +91,7 @@ class User(UserInDB):
 # Authors
 class AuthorBase(BaseModel):
     """Base author schema"""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: str = NAME_FIELD
     biography: Optional[str] = None
     birth_date: Optional[datetime] = None
     death_date: Optional[datetime] = None
@@ -68,7 +105,7 @@ class AuthorCreate(AuthorBase):
 
 class AuthorUpdate(BaseModel):
     """Schema for author update"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[str] = NAME_OPT
     biography: Optional[str] = None
     birth_date: Optional[datetime] = None
     death_date: Optional[datetime] = None
@@ -86,7 +123,7 @@ class Author(AuthorBase, TimestampMixin):
 # Genres
 class GenreBase(BaseModel):
     """Base genre schema"""
-    name: str = Field(..., min_length=1, max_length=100)
+    name: str = GENRE_NAME_FIELD
     description: Optional[str] = None
 
 
@@ -97,7 +134,7 @@ class GenreCreate(GenreBase):
 
 class GenreUpdate(BaseModel):
     """Schema for genre update"""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[str] = GENRE_NAME_OPT
     description: Optional[str] = None
 
 
@@ -108,38 +145,44 @@ class Genre(GenreBase):
     
     id: int
     created_at: datetime
+    
+    @field_serializer("created_at")
+    def serialize_created_at(self, value: datetime) -> int:
+        return to_epoch(value)
 
 
 # Books
 class BookBase(BaseModel):
     """Base book schema"""
-    title: str = Field(..., min_length=1, max_length=500)
-    isbn: Optional[str] = Field(None, max_length=20)
+    title: str = TITLE_FIELD
+    isbn: Optional[str] = ISBN_OPT
     description: Optional[str] = None
     publication_date: Optional[datetime] = None
-    page_count: Optional[int] = Field(None, gt=0)
-    language: str = Field(default="ru", max_length=10)
-    price: Optional[float] = Field(None, ge=0)
-    cover_image_url: Optional[str] = Field(None, max_length=500)
+    page_count: Optional[int] = PAGE_COUNT_OPT
+    language: str = "ru"
+    price: Optional[float] = PRICE_OPT
+    cover_image_url: Optional[str] = COVER_URL_OPT
     is_available: bool = True
 
 
 class BookCreate(BookBase):
     """Schema for book creation"""
+    # Only input is restricted to the supported codes; stored rows may hold others
+    language: Language = "ru"
     author_ids: List[int] = Field(..., min_items=1)
     genre_ids: List[int] = Field(..., min_items=1)
 
 
 class BookUpdate(BaseModel):
     """Schema for book update"""
-    title: Optional[str] = Field(None, min_length=1, max_length=500)
-    isbn: Optional[str] = Field(None, max_length=20)
+    title: Optional[str] = TITLE_OPT
+    isbn: Optional[str] = ISBN_OPT
     description: Optional[str] = None
     publication_date: Optional[datetime] = None
-    page_count: Optional[int] = Field(None, gt=0)
-    language: Optional[str] = Field(None, max_length=10)
-    price: Optional[float] = Field(None, ge=0)
-    cover_image_url: Optional[str] = Field(None, max_length=500)
+    page_count: Optional[int] = PAGE_COUNT_OPT
+    language: Optional[Language] = None
+    price: Optional[float] = PRICE_OPT
+    cover_image_url: Optional[str] = COVER_URL_OPT
     is_available: Optional[bool] = None
     author_ids: Optional[List[int]] = None
     genre_ids: Optional[List[int]] = None
@@ -153,6 +196,10 @@ class Book(BookBase, TimestampMixin):
     id: int
     authors: List[Author] = []
     genres: List[Genre] = []
+    
+    @field_serializer("publication_date")
+    def serialize_publication_date(self, value: Optional[datetime]) -> Optional[int]:
+        return to_epoch(value)
 
 
 class BookWithStats(Book):
@@ -164,7 +211,7 @@ class BookWithStats(Book):
 # Reviews
 class ReviewBase(BaseModel):
     """Base review schema"""
-    rating: int = Field(..., ge=1, le=5)
+    rating: int = RATING_FIELD
     title: Optional[str] = Field(None, max_length=255)
     content: Optional[str] = None
 
@@ -176,7 +223,7 @@ class ReviewCreate(ReviewBase):
 
 class ReviewUpdate(BaseModel):
     """Schema for review update"""
-    rating: Optional[int] = Field(None, ge=1, le=5)
+    rating: Optional[int] = RATING_OPT
     title: Optional[str] = Field(None, max_length=255)
     content: Optional[str] = None
 
@@ -196,7 +243,7 @@ class Review(ReviewBase, TimestampMixin):
 # Reading lists
 class ReadingListBase(BaseModel):
     """Base reading list schema"""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: str = NAME_FIELD
     description: Optional[str] = None
     is_public: bool = False
 
@@ -208,7 +255,7 @@ class ReadingListCreate(ReadingListBase):
 
 class ReadingListUpdate(BaseModel):
     """Schema for reading list update"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[str] = NAME_OPT
     description: Optional[str] = None
     is_public: Optional[bool] = None
 
@@ -291,6 +338,12 @@ class BookSortBy(str, Enum):
     RATING = "rating"
 
 
+class ResponseFormat(str, Enum):
+    """List response layout"""
+    ROWS = "rows"
+    COLUMNAR = "columnar"
+
+
 # Pagination
 class PaginationParams(BaseModel):
     """Pagination parameters"""
@@ -303,8 +356,24 @@ class PaginatedResponse(BaseModel):
     items: List[Union[Book, Author, Genre, Review, ReadingList]]
     total: int
     page: int
-    size: int
-    pages: int
+    size: int = Field(..., ge=1)
+    
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def pages(self) -> int:
+        """Number of pages, derived from total and size (ceiling division)"""
+        return -(-self.total // self.size)
+
+
+class BookColumnar(BaseModel):
+    """Column-oriented book list (one array per field instead of one object per book)"""
+    ids: List[int] = []
+    titles: List[str] = []
+    isbns: List[Optional[str]] = []
+    languages: List[str] = []
+    prices: List[Optional[float]] = []
+    page_counts: List[Optional[int]] = []
+    is_available: List[bool] = []
 
 
 # Statistics
@@ -322,4 +391,14 @@ class UserStats(BaseModel):
     total_users: int
     active_users: int
     total_reviews: int
-    total_reading_lists: int
\ No newline at end of file
+    total_reading_lists: int
+
+
+# Prebuilt adapters for list responses, created once at import instead of per request
+BOOK_LIST_ADAPTER = TypeAdapter(List[Book])
+REVIEW_LIST_ADAPTER = TypeAdapter(List[Review])
+
+
+def dump_list_json(adapter: TypeAdapter, rows: list) -> bytes:
+    """Validate ORM rows through a list adapter and serialize them to JSON bytes"""
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
\ No newline at end of file
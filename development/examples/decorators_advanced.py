@@ -11,7 +11,7 @@ from typing import (
     Union, Tuple, Protocol, runtime_checkable
 )
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import asyncio
 import inspect
 
@@ -25,37 +25,50 @@ T = TypeVar('T')
 F = TypeVar('F', bound=Callable[..., Any])
 R = TypeVar('R')  # Return type
 
+perf_counter_ns = time.perf_counter_ns
+
 
 # 1. TIMER DECORATOR
+def timer_sync(func: F) -> F:
+    """Decorator for measuring synchronous function execution time"""
+    @functools.wraps(func)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_ns = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed_ns = perf_counter_ns() - start_ns
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("⏱️ %s executed in %.4f seconds", func.__name__, elapsed_ns / 1e9)
+    return sync_wrapper  # type: ignore
+
+
+def timer_async(func: F) -> F:
+    """Decorator for measuring coroutine function execution time"""
+    @functools.wraps(func)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Nothing would be logged, so skip timing altogether
+        if not logger.isEnabledFor(logging.INFO):
+            return await func(*args, **kwargs)
+        
+        start_ns = perf_counter_ns()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            elapsed_ns = perf_counter_ns() - start_ns
+            logger.info("⏱️ %s executed in %.4f seconds", func.__name__, elapsed_ns / 1e9)
+    return async_wrapper  # type: ignore
+
+
 def timer(func: F) -> F:
     """
     Decorator for measuring function execution time
     Supports both synchronous and asynchronous functions
+    
+    Dispatches to timer_sync / timer_async; use those directly
+    when the kind of function is known to skip the check.
     """
-    if asyncio.iscoroutinefunction(func):
-        @functools.wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.perf_counter()
-            try:
-                result = await func(*args, **kwargs)
-                return result
-            finally:
-                end_time = time.perf_counter()
-                execution_time = end_time - start_time
-                logger.info(f"⏱️ {func.__name__} executed in {execution_time:.4f} seconds")
-        return async_wrapper  # type: ignore
-    else:
-        @functools.wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.perf_counter()
-            try:
-                result = func(*args, **kwargs)
-                return result
-            finally:
-                end_time = time.perf_counter()
-                execution_time = end_time - start_time
-                logger.info(f"⏱️ {func.__name__} executed in {execution_time:.4f} seconds")
-        return sync_wrapper  # type: ignore
+    return timer_async(func) if inspect.iscoroutinefunction(func) else timer_sync(func)
 
 
 # 2. RETRY DECORATOR FOR ERRORS
@@ -75,36 +88,64 @@ def retry(
         exceptions: Exception types to retry on
     """
     def decorator(func: F) -> F:
+        sleep = time.sleep
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             current_delay = delay
-            last_exception = None
+            attempt = 1
             
-            for attempt in range(max_attempts):
+            # All attempts except the last one: catch, log and wait
+            while attempt < max_attempts:
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt == max_attempts - 1:  # Last attempt
-                        logger.error(f"❌ {func.__name__} failed to execute after {max_attempts} attempts")
-                        raise e
-                    
-                    logger.warning(f"🔄 {func.__name__} attempt {attempt + 1} failed: {e}")
-                    logger.info(f"⏳ Waiting {current_delay:.2f} seconds...")
-                    time.sleep(current_delay)
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("🔄 %s attempt %d failed: %s", func.__name__, attempt, e)
+                        logger.info("⏳ Waiting %.2f seconds...", current_delay)
+                    sleep(current_delay)
                     current_delay *= backoff
+                    attempt += 1
             
-            # This code should never execute, but for typing
-            if last_exception:
-                raise last_exception
+            # Last attempt: exceptions propagate to the caller
+            try:
+                return func(*args, **kwargs)
+            except exceptions:
+                logger.error("❌ %s failed to execute after %d attempts", func.__name__, max_attempts)
+                raise
                 
         return wrapper  # type: ignore
     return decorator
 
 
 # 3. ADVANCED CACHING DECORATOR
+SWEEP_INTERVAL = 4096  # Calls between full expiry sweeps of a TTL cache
+
+# Separates positional args from keyword items in cache keys, so that
+# f(('a', 2)) and f(a=2) don't share an entry (same idea as functools' kwd_mark)
+_KWD_MARK = object()
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any], typed: bool = False) -> Tuple[Any, ...]:
+    """Create hashable cache key (no string formatting)"""
+    key = args
+    if kwargs:
+        key += (_KWD_MARK,) + tuple(sorted(kwargs.items()))
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        key += tuple(type(v) for _, v in sorted(kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable arguments (lists, dicts): fall back to string form
+        return (str(key),)
+    return key
+
+
 class CacheStats:
     """Cache statistics"""
+    __slots__ = ("hits", "misses", "cache_size")
+    
     def __init__(self) -> None:
         self.hits: int = 0
         self.misses: int = 0
@@ -112,8 +153,10 @@ class CacheStats:
     
     @property
     def hit_rate(self) -> float:
-        total = self.hits + self.misses
-        return (self.hits / total * 100) if total > 0 else 0.0
+        try:
+            return self.hits * 100.0 / (self.hits + self.misses)
+        except ZeroDivisionError:
+            return 0.0
     
     def __str__(self) -> str:
         return f"Cache(hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.1f}%, size={self.cache_size})"
@@ -127,91 +170,73 @@ def cache(
     """
     Advanced caching decorator
     
+    Entries are kept in an OrderedDict LRU; with ttl they are also expired
+    lazily when looked up. Both modes expose the same cache_info() stats.
+    
     Args:
         maxsize: Maximum cache size (None = unlimited)
         ttl: Time to live for entries in seconds (None = forever)
         typed: Distinguish argument types (True/False)
     """
     def decorator(func: F) -> F:
-        cache_data: Dict[str, Tuple[Any, float]] = {}
+        cache_data: "OrderedDict[Tuple[Any, ...], Tuple[Any, float]]" = OrderedDict()
         stats = CacheStats()
         
-        def make_key(*args: Any, **kwargs: Any) -> str:
-            """Create cache key"""
-            key_parts = []
-            
-            # Add positional arguments
-            for arg in args:
-                if typed:
-                    key_parts.append(f"{type(arg).__name__}:{arg}")
-                else:
-                    key_parts.append(str(arg))
-            
-            # Add keyword arguments
-            for k, v in sorted(kwargs.items()):
-                if typed:
-                    key_parts.append(f"{k}={type(v).__name__}:{v}")
-                else:
-                    key_parts.append(f"{k}={v}")
-            
-            return "|".join(key_parts)
-        
-        def is_expired(timestamp: float) -> bool:
-            """Check TTL expiration"""
-            if ttl is None:
-                return False
-            return time.time() - timestamp > ttl
-        
         def cleanup_expired() -> None:
             """Clean up expired entries"""
             if ttl is None:
                 return
+            oldest_allowed = time.time() - ttl
+            cache_data_pop = cache_data.pop
             
-            current_time = time.time()
-            expired_keys = [
-                key for key, (_, timestamp) in cache_data.items()
-                if current_time - timestamp > ttl
-            ]
-            
-            for key in expired_keys:
-                del cache_data[key]
+            # Snapshot items once, then pop expired entries in the same pass
+            for key, (_, timestamp) in list(cache_data.items()):
+                if timestamp < oldest_allowed:
+                    cache_data_pop(key, None)
             
             stats.cache_size = len(cache_data)
         
+        # Bind frequently used callables once
+        time_time = time.time
+        cache_move = cache_data.move_to_end
+        cache_pop = cache_data.popitem
+        call_count = [0]
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Clean up expired entries
-            cleanup_expired()
+            # Full sweep only every SWEEP_INTERVAL calls, so entries that are
+            # never looked up again don't pile up in long-running processes
+            if ttl is not None:
+                call_count[0] += 1
+                if call_count[0] % SWEEP_INTERVAL == 0:
+                    cleanup_expired()
             
-            # Create key
-            cache_key = make_key(*args, **kwargs)
+            cache_key = _make_key(args, kwargs, typed)
             
-            # Check cache
-            if cache_key in cache_data:
+            # Check cache (single lookup, expired entries are dropped lazily here)
+            try:
                 value, timestamp = cache_data[cache_key]
-                if not is_expired(timestamp):
+            except KeyError:
+                pass
+            else:
+                if ttl is None or time_time() - timestamp <= ttl:
+                    cache_move(cache_key)
                     stats.hits += 1
-                    logger.debug(f"💾 Cache HIT for {func.__name__}")
+                    logger.debug("💾 Cache HIT for %s", func.__name__)
                     return value
-                else:
-                    # Remove expired entry
-                    del cache_data[cache_key]
+                del cache_data[cache_key]
             
             # Calculate value
             stats.misses += 1
-            logger.debug(f"🔍 Cache MISS for {func.__name__}")
+            logger.debug("🔍 Cache MISS for %s", func.__name__)
             result = func(*args, **kwargs)
             
             # Save to cache
-            current_time = time.time()
-            cache_data[cache_key] = (result, current_time)
+            cache_data[cache_key] = (result, time_time())
             
-            # Check cache size
+            # Evict least recently used entry
             if maxsize is not None and len(cache_data) > maxsize:
-                # Remove oldest entry (simple strategy)
-                oldest_key = min(cache_data.keys(), 
-                               key=lambda k: cache_data[k][1])
-                del cache_data[oldest_key]
+                cache_pop(last=False)
             
             stats.cache_size = len(cache_data)
             return result
@@ -219,6 +244,7 @@ def cache(
         # Add cache management methods
         wrapper.cache_info = lambda: stats  # type: ignore
         wrapper.cache_clear = lambda: cache_data.clear()  # type: ignore
+        wrapper.cache_cleanup = cleanup_expired  # type: ignore
         
         return wrapper  # type: ignore
     return decorator
@@ -237,12 +263,15 @@ class Validator(Protocol):
 
 class RangeValidator:
     """Number range validator"""
+    __slots__ = ("min_val", "max_val")
+    _NUMERIC = (int, float)
+    
     def __init__(self, min_val: float, max_val: float) -> None:
         self.min_val = min_val
         self.max_val = max_val
     
     def validate(self, value: Any) -> bool:
-        return isinstance(value, (int, float)) and self.min_val <= value <= self.max_val
+        return isinstance(value, self._NUMERIC) and self.min_val <= value <= self.max_val
     
     def get_error_message(self, value: Any) -> str:
         return f"Value {value} must be in range [{self.min_val}, {self.max_val}]"
@@ -250,6 +279,8 @@ class RangeValidator:
 
 class TypeValidator:
     """Type validator"""
+    __slots__ = ("expected_type",)
+    
     def __init__(self, expected_type: type) -> None:
         self.expected_type = expected_type
     
@@ -273,23 +304,35 @@ def validate_args(**validators: Validator) -> Callable[[F], F]:
             ...
     """
     def decorator(func: F) -> F:
-        # Get function parameter information
+        # Resolve where each validated parameter comes from once, at decoration time
         sig = inspect.signature(func)
-        param_names = list(sig.parameters.keys())
+        missing = object()
+        checks: List[Tuple[Optional[int], str, Any, Callable[[Any], bool], Callable[[Any], str]]] = []
+        
+        for index, (param_name, param) in enumerate(sig.parameters.items()):
+            validator = validators.get(param_name)
+            if validator is None or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                continue
+            # Parameters after *args / keyword-only ones can only come from kwargs
+            position = index if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD) else None
+            default = missing if param.default is param.empty else param.default
+            checks.append((position, param_name, default, validator.validate, validator.get_error_message))
+        frozen_checks = tuple(checks)
         
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Create dictionary of all arguments
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            
-            # Validate each argument
-            for param_name, validator in validators.items():
-                if param_name in bound_args.arguments:
-                    value = bound_args.arguments[param_name]
-                    if not validator.validate(value):
-                        error_msg = validator.get_error_message(value)
-                        raise ValueError(f"Validation of parameter '{param_name}' failed: {error_msg}")
+            # Validate each argument without building a BoundArguments object
+            num_args = len(args)
+            for position, param_name, default, validate, error_message in frozen_checks:
+                if position is not None and position < num_args:
+                    value = args[position]
+                else:
+                    value = kwargs.get(param_name, default)
+                    if value is missing:
+                        continue  # Let the call itself report the missing argument
+                if not validate(value):
+                    error_msg = error_message(value)
+                    raise ValueError(f"Validation of parameter '{param_name}' failed: {error_msg}")
             
             return func(*args, **kwargs)
         
@@ -308,64 +351,143 @@ def log_calls(
     Decorator for logging function calls
     """
     def decorator(func: F) -> F:
+        def shorten(value: Any) -> str:
+            """Convert value to string once and truncate it"""
+            text = str(value)
+            return text if len(text) <= max_arg_length else text[:max_arg_length] + "..."
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Skip the call/result formatting when the level is disabled,
+            # but still log exceptions at ERROR
+            if not logger.isEnabledFor(level):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger.error("❌ %s raised exception: %s", func.__name__, e)
+                    raise
+            
             # Prepare argument information
             args_info = ""
             if include_args:
-                args_str = ", ".join([
-                    str(arg)[:max_arg_length] + ("..." if len(str(arg)) > max_arg_length else "")
-                    for arg in args
-                ])
-                kwargs_str = ", ".join([
-                    f"{k}={str(v)[:max_arg_length]}" + ("..." if len(str(v)) > max_arg_length else "")
-                    for k, v in kwargs.items()
-                ])
-                all_args = [args_str, kwargs_str] if args_str and kwargs_str else [args_str or kwargs_str]
-                args_info = f"({', '.join(filter(None, all_args))})"
+                parts = [shorten(arg) for arg in args]
+                parts.extend(f"{k}={shorten(v)}" for k, v in kwargs.items())
+                args_info = f"({', '.join(parts)})"
             
-            logger.log(level, f"🔵 Calling {func.__name__}{args_info}")
+            logger.log(level, "🔵 Calling %s%s", func.__name__, args_info)
             
             try:
                 result = func(*args, **kwargs)
                 
                 if include_result:
-                    result_str = str(result)[:max_arg_length]
-                    if len(str(result)) > max_arg_length:
-                        result_str += "..."
-                    logger.log(level, f"✅ {func.__name__} returned: {result_str}")
+                    logger.log(level, "✅ %s returned: %s", func.__name__, shorten(result))
                 else:
-                    logger.log(level, f"✅ {func.__name__} executed successfully")
+                    logger.log(level, "✅ %s executed successfully", func.__name__)
                 
                 return result
             
             except Exception as e:
-                logger.log(logging.ERROR, f"❌ {func.__name__} raised exception: {e}")
+                logger.error("❌ %s raised exception: %s", func.__name__, e)
+                raise
+        
+        return wrapper  # type: ignore
+    return decorator
+
+
+# 6. COMBINED DECORATOR (cache + timer + logging in one wrapper)
+def combined(
+    maxsize: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    timed: bool = True,
+    logged: bool = True,
+    level: int = logging.INFO
+) -> Callable[[F], F]:
+    """
+    Fused replacement for stacking @timer, @cache and @log_calls
+    
+    One wrapper frame and one args/kwargs packing per call instead of three.
+    Cache hits return immediately without timing or logging. Keys are built
+    like cache() builds them, and exceptions are logged (as log_calls does)
+    only when logged is true.
+    """
+    def decorator(func: F) -> F:
+        cache_data: "OrderedDict[Tuple[Any, ...], Tuple[Any, float]]" = OrderedDict()
+        stats = CacheStats()
+        name = func.__name__
+        time_time = time.time
+        cache_move = cache_data.move_to_end
+        cache_pop = cache_data.popitem
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _make_key(args, kwargs)
+            
+            try:
+                value, timestamp = cache_data[key]
+            except KeyError:
+                pass
+            else:
+                if ttl is None or time_time() - timestamp <= ttl:
+                    cache_move(key)
+                    stats.hits += 1
+                    return value
+                del cache_data[key]
+            
+            stats.misses += 1
+            log_enabled = logged and logger.isEnabledFor(level)
+            if log_enabled:
+                logger.log(level, "🔵 Calling %s%r", name, args)
+            
+            start_ns = perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if logged:
+                    logger.error("❌ %s raised exception: %s", name, e)
                 raise
+            elapsed_ns = perf_counter_ns() - start_ns
+            
+            cache_data[key] = (result, time_time())
+            if maxsize is not None and len(cache_data) > maxsize:
+                cache_pop(last=False)
+            stats.cache_size = len(cache_data)
+            
+            if log_enabled:
+                logger.log(level, "✅ %s returned: %s", name, result)
+            if timed and logger.isEnabledFor(logging.INFO):
+                logger.info("⏱️ %s executed in %.4f seconds", name, elapsed_ns / 1e9)
+            return result
+        
+        wrapper.cache_info = lambda: stats  # type: ignore
+        wrapper.cache_clear = lambda: cache_data.clear()  # type: ignore
         
         return wrapper  # type: ignore
     return decorator
 
 
 # DEMONSTRATION OF ALL DECORATORS
+def _fib(n: int) -> int:
+    """Iterative Fibonacci kernel (decorators stay on the public method, not in the loop)"""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
 class MathOperations:
     """Class for demonstrating decorators"""
     
-    @timer
-    @cache(maxsize=50, ttl=10.0)
-    @log_calls(include_result=True)
+    @combined(maxsize=50, ttl=10.0)
     def fibonacci(self, n: int) -> int:
         """Calculate Fibonacci number with caching"""
-        if n <= 1:
-            return n
-        return self.fibonacci(n - 1) + self.fibonacci(n - 2)
+        return _fib(n)
     
     @retry(max_attempts=3, delay=0.1, exceptions=(ValueError, ZeroDivisionError))
     @validate_args(
         a=TypeValidator(float),
         b=TypeValidator(float)
     )
-    @timer
+    @timer_sync
     def divide(self, a: float, b: float) -> float:
         """Division with retry on errors"""
         if b == 0:
@@ -3,8 +3,11 @@ Practical exercises for advanced OOP
 Try to complete these exercises on your own!
 """
 
+import functools
+from collections import defaultdict
 from task_system import *
 from datetime import datetime, timedelta
+from typing import ClassVar, Dict, List, Optional
 
 
 def practice_1_custom_task():
@@ -76,17 +79,19 @@ def practice_4_advanced_context():
 class PersonalTask(BaseTask, TimestampMixin):
     """Solution for exercise 1"""
     
+    # Shared by all instances instead of being rebuilt on every call
+    PRIORITY_MAP: ClassVar[Dict[str, Priority]] = {
+        "health": Priority.URGENT,
+        "family": Priority.HIGH,
+        "hobby": Priority.LOW
+    }
+    
     def __init__(self, title: str, description: str = "", category: str = "general"):
         super().__init__(title, description)
         self.category = category
     
     def get_priority(self) -> Priority:
-        priority_map = {
-            "health": Priority.URGENT,
-            "family": Priority.HIGH,
-            "hobby": Priority.LOW
-        }
-        return priority_map.get(self.category.lower(), Priority.MEDIUM)
+        return self.PRIORITY_MAP.get(self.category.lower(), Priority.MEDIUM)
     
     def estimate_duration(self) -> timedelta:
         return timedelta(hours=2)
@@ -95,12 +100,23 @@ class PersonalTask(BaseTask, TimestampMixin):
 class ExtendedTaskManager(TaskManager):
     """Solution for exercise 2"""
     
+    def __init__(self, filename: str = "tasks.json"):
+        super().__init__(filename)
+        # Indexes filled once in add_task, so lookups don't rescan all tasks
+        # (priority and assignee are taken as of the moment the task is added)
+        self._by_priority: Dict[Priority, List[BaseTask]] = defaultdict(list)
+        self._by_assignee: Dict[Optional[str], List[BaseTask]] = defaultdict(list)
+    
+    def add_task(self, task: BaseTask) -> None:
+        super().add_task(task)
+        self._by_priority[task.get_priority()].append(task)
+        self._by_assignee[getattr(task, 'assignee', None)].append(task)
+    
     def get_tasks_by_priority(self, priority: Priority) -> List[BaseTask]:
-        return [task for task in self.tasks if task.get_priority() == priority]
+        return list(self._by_priority.get(priority, ()))
     
     def get_tasks_by_assignee(self, assignee: str) -> List[BaseTask]:
-        return [task for task in self.tasks 
-                if hasattr(task, 'assignee') and task.assignee == assignee]
+        return list(self._by_assignee.get(assignee, ()))
     
     def get_completion_rate(self) -> float:
         if not self.tasks:
@@ -111,11 +127,12 @@ class ExtendedTaskManager(TaskManager):
 
 def log_task_changes(func):
     """Solution for exercise 3 - logging decorator"""
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         old_status = self.status
         result = func(self, *args, **kwargs)
         new_status = self.status
-        if old_status != new_status:
+        if old_status is not new_status:  # Enum members are singletons
             print(f"📝 Task '{self.title}': {old_status.value} -> {new_status.value}")
         return result
     return wrapper
@@ -6,8 +6,9 @@ Learning: ABC, multiple inheritance, property, magic methods, context managers
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import count
 from typing import List, Optional, Dict, Any
-import json
+import orjson
 
 
 class TaskStatus(Enum):
@@ -18,6 +19,10 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# Enum.value goes through a descriptor on every access; plain dict lookup is cheaper in loops
+STATUS_VALUES: Dict[TaskStatus, str] = {status: status.value for status in TaskStatus}
+
+
 class Priority(Enum):
     """Task priorities"""
     LOW = 1
@@ -26,16 +31,38 @@ class Priority(Enum):
     URGENT = 4
 
 
+# Task ID sequence (itertools.count is atomic under the GIL)
+_task_ids = count(1)
+
+# Duration estimates (timedelta is immutable, so the same objects are returned every time)
+SIMPLE_TASK_DURATIONS: Dict[Priority, timedelta] = {
+    Priority.LOW: timedelta(minutes=30),
+    Priority.MEDIUM: timedelta(hours=1),
+    Priority.HIGH: timedelta(minutes=90),
+    Priority.URGENT: timedelta(hours=2)
+}
+WORK_TASK_DURATION = timedelta(hours=4)
+URGENT_TASK_DURATION = timedelta(hours=1)
+
+
 # Abstract base class
 class BaseTask(ABC):
     """Abstract base class for all tasks"""
     
+    # Attributes live in slots. Reading task.id in manager loops is a direct
+    # slot access; title and description stay validating properties and
+    # status is read-only (it changes through _set_status, which keeps the
+    # manager's index in sync)
+    __slots__ = ('_title', '_description', '_status', 'created_at', 'id', '_manager')
+    
     def __init__(self, title: str, description: str = ""):
-        self._title = title
-        self._description = description
-        self._created_at = datetime.now()
+        super().__init__()  # Runs the mixins' __init__ (timestamps, assignee)
+        self.title = title
+        self.description = description
         self._status = TaskStatus.TODO
-        self._id = id(self)  # Simple ID based on memory address
+        self.created_at = datetime.now()
+        self.id = next(_task_ids)  # Small sequential ID (1, 2, 3, ...)
+        self._manager = None
     
     @property
     def title(self) -> str:
@@ -61,13 +88,12 @@ class BaseTask(ABC):
     def status(self) -> TaskStatus:
         return self._status
     
-    @property
-    def created_at(self) -> datetime:
-        return self._created_at
-    
-    @property
-    def id(self) -> int:
-        return self._id
+    def _set_status(self, new_status: TaskStatus) -> None:
+        """Change status and let the owning manager update its index"""
+        old_status = self._status
+        self._status = new_status
+        if self._manager is not None:
+            self._manager._on_status_change(self, old_status, new_status)
     
     @abstractmethod
     def get_priority(self) -> Priority:
@@ -81,24 +107,24 @@ class BaseTask(ABC):
     
     def start(self) -> None:
         """Start task execution"""
-        if self._status == TaskStatus.TODO:
-            self._status = TaskStatus.IN_PROGRESS
+        if self.status == TaskStatus.TODO:
+            self._set_status(TaskStatus.IN_PROGRESS)
         else:
-            raise ValueError(f"Cannot start task with status {self._status.value}")
+            raise ValueError(f"Cannot start task with status {self.status.value}")
     
     def complete(self) -> None:
         """Complete task"""
-        if self._status == TaskStatus.IN_PROGRESS:
-            self._status = TaskStatus.DONE
+        if self.status == TaskStatus.IN_PROGRESS:
+            self._set_status(TaskStatus.DONE)
         else:
-            raise ValueError(f"Cannot complete task with status {self._status.value}")
+            raise ValueError(f"Cannot complete task with status {self.status.value}")
     
     def cancel(self) -> None:
         """Cancel task"""
-        if self._status in [TaskStatus.TODO, TaskStatus.IN_PROGRESS]:
-            self._status = TaskStatus.CANCELLED
+        if self.status in [TaskStatus.TODO, TaskStatus.IN_PROGRESS]:
+            self._set_status(TaskStatus.CANCELLED)
         else:
-            raise ValueError(f"Cannot cancel task with status {self._status.value}")
+            raise ValueError(f"Cannot cancel task with status {self.status.value}")
     
     # Magic methods
     def __str__(self) -> str:
@@ -124,6 +150,8 @@ class BaseTask(ABC):
 class TimestampMixin:
     """Mixin for tracking change timestamps"""
     
+    __slots__ = ()  # Storage is declared by the concrete task classes
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._updated_at = datetime.now()
@@ -140,6 +168,8 @@ class TimestampMixin:
 class AssigneeMixin:
     """Mixin for assigning executor"""
     
+    __slots__ = ()  # Storage is declared by the concrete task classes
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._assignee: Optional[str] = None
@@ -159,6 +189,8 @@ class AssigneeMixin:
 class SimpleTask(BaseTask, TimestampMixin):
     """Simple task"""
     
+    __slots__ = ('_updated_at', '_priority')
+    
     def __init__(self, title: str, description: str = "", priority: Priority = Priority.MEDIUM):
         super().__init__(title, description)
         self._priority = priority
@@ -168,18 +200,14 @@ class SimpleTask(BaseTask, TimestampMixin):
     
     def estimate_duration(self) -> timedelta:
         # Simple task - 30 minutes to 2 hours depending on priority
-        base_hours = {
-            Priority.LOW: 0.5,
-            Priority.MEDIUM: 1,
-            Priority.HIGH: 1.5,
-            Priority.URGENT: 2
-        }
-        return timedelta(hours=base_hours[self._priority])
+        return SIMPLE_TASK_DURATIONS[self._priority]
 
 
 class WorkTask(BaseTask, TimestampMixin, AssigneeMixin):
     """Work task with assignee"""
     
+    __slots__ = ('_updated_at', '_assignee')
+    
     def __init__(self, title: str, description: str = "", assignee: Optional[str] = None):
         super().__init__(title, description)
         self.assignee = assignee
@@ -190,12 +218,14 @@ class WorkTask(BaseTask, TimestampMixin, AssigneeMixin):
     
     def estimate_duration(self) -> timedelta:
         # Work tasks usually take more time
-        return timedelta(hours=4)
+        return WORK_TASK_DURATION
 
 
 class UrgentTask(BaseTask, TimestampMixin, AssigneeMixin):
     """Urgent task"""
     
+    __slots__ = ('_updated_at', '_assignee', '_deadline')
+    
     def __init__(self, title: str, description: str = "", deadline: Optional[datetime] = None):
         super().__init__(title, description)
         self._deadline = deadline or (datetime.now() + timedelta(hours=24))
@@ -207,13 +237,17 @@ class UrgentTask(BaseTask, TimestampMixin, AssigneeMixin):
     @property
     def is_overdue(self) -> bool:
         """Check if overdue"""
-        return datetime.now() > self._deadline and self.status != TaskStatus.DONE
+        return self.is_overdue_at(datetime.now())
+    
+    def is_overdue_at(self, now: datetime) -> bool:
+        """Check if overdue at the given moment (lets callers read the clock once)"""
+        return now > self._deadline and self.status is not TaskStatus.DONE
     
     def get_priority(self) -> Priority:
         return Priority.URGENT
     
     def estimate_duration(self) -> timedelta:
-        return timedelta(hours=1)
+        return URGENT_TASK_DURATION
 
 
 # Context Manager for working with tasks
@@ -224,23 +258,37 @@ class TaskManager:
         self.filename = filename
         self.tasks: List[BaseTask] = []
         self._in_context = False
+        # Indexes for O(1) lookups; status buckets are dicts used as ordered sets
+        self._by_id: Dict[int, BaseTask] = {}
+        self._by_status: Dict[TaskStatus, Dict[BaseTask, None]] = {status: {} for status in TaskStatus}
+        self._urgent: List[UrgentTask] = []
     
     def add_task(self, task: BaseTask) -> None:
         """Add task"""
         self.tasks.append(task)
+        self._by_id[task.id] = task
+        self._by_status[task.status][task] = None
+        if isinstance(task, UrgentTask):
+            self._urgent.append(task)
+        task._manager = self
+    
+    def _on_status_change(self, task: BaseTask, old_status: TaskStatus, new_status: TaskStatus) -> None:
+        """Move task between status buckets (called by the task itself)"""
+        self._by_status[old_status].pop(task, None)
+        self._by_status[new_status][task] = None
     
     def get_task_by_id(self, task_id: int) -> Optional[BaseTask]:
         """Find task by ID"""
-        return next((task for task in self.tasks if task.id == task_id), None)
+        return self._by_id.get(task_id)
     
     def get_tasks_by_status(self, status: TaskStatus) -> List[BaseTask]:
         """Get tasks by status"""
-        return [task for task in self.tasks if task.status == status]
+        return list(self._by_status[status])
     
     def get_overdue_tasks(self) -> List[UrgentTask]:
         """Get overdue tasks"""
-        return [task for task in self.tasks 
-                if isinstance(task, UrgentTask) and task.is_overdue]
+        now = datetime.now()
+        return [task for task in self._urgent if task.is_overdue_at(now)]
     
     # Context Manager methods
     def __enter__(self):
@@ -271,19 +319,23 @@ class TaskManager:
     def _save_tasks(self) -> None:
         """Save tasks to file (simplified version)"""
         # In a real project, this would be serialization
-        task_data = []
-        for task in self.tasks:
-            task_data.append({
-                'id': task.id,
-                'title': task.title,
-                'description': task.description,
-                'status': task.status.value,
-                'type': task.__class__.__name__,
-                'created_at': task.created_at.isoformat()
-            })
-        
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            json.dump(task_data, f, ensure_ascii=False, indent=2)
+        # Records are encoded one by one straight into the file (no intermediate list);
+        # orjson writes datetimes natively in ISO format
+        dumps = orjson.dumps
+        with open(self.filename, 'wb') as f:
+            f.write(b'[')
+            for index, task in enumerate(self.tasks):
+                if index:
+                    f.write(b',\n')
+                f.write(dumps({
+                    'id': task.id,
+                    'title': task.title,
+                    'description': task.description,
+                    'status': STATUS_VALUES[task.status],
+                    'type': task.__class__.__name__,
+                    'created_at': task.created_at
+                }))
+            f.write(b']')
     
     def __len__(self) -> int:
         """Number of tasks"""
@@ -11,17 +11,20 @@ from typing import (
     # Special types
     Literal, Final, ClassVar, TypedDict, NamedTuple,
     # For working with functions
-    Awaitable, Coroutine, AsyncGenerator, Generator,
+    Awaitable, Coroutine, AsyncGenerator, Generator, Iterator,
     # For validation
-    get_type_hints, get_origin, get_args
+    get_type_hints, get_origin, get_args,
+    # Python 3.11+ (no typing_extensions import needed)
+    Self, ParamSpec, Concatenate
 )
-from typing_extensions import Self, ParamSpec, Concatenate
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-import asyncio
+from collections import OrderedDict
 from collections.abc import Sequence, Mapping
+import functools
 import json
+import math
 
 
 # 1. GENERIC TYPES
@@ -62,29 +65,33 @@ class Stack(Generic[T]):
     def __len__(self) -> int:
         return len(self._items)
     
-    def __iter__(self) -> Generator[T, None, None]:
+    def __iter__(self) -> Iterator[T]:
         """Iterate over stack (top to bottom)"""
-        for item in reversed(self._items):
-            yield item
+        return reversed(self._items)
 
 
 class Cache(Generic[K, V]):
-    """Typed cache"""
+    """Typed cache (least recently used entries are evicted first)"""
     
     def __init__(self, max_size: int = 100) -> None:
-        self._data: Dict[K, V] = {}
+        self._data: OrderedDict[K, V] = OrderedDict()
         self._max_size = max_size
     
     def get(self, key: K) -> Optional[V]:
         """Get value by key"""
-        return self._data.get(key)
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
     
     def set(self, key: K, value: V) -> None:
         """Set value"""
-        if len(self._data) >= self._max_size and key not in self._data:
-            # Remove first element (simple strategy)
-            first_key = next(iter(self._data))
-            del self._data[first_key]
+        if key in self._data:
+            self._data.move_to_end(key)
+        elif len(self._data) >= self._max_size:
+            # Remove least recently used element
+            self._data.popitem(last=False)
         
         self._data[key] = value
     
@@ -216,7 +223,7 @@ class Point(NamedTuple):
     
     def distance_to(self, other: 'Point') -> float:
         """Distance to another point"""
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        return math.hypot(self.x - other.x, self.y - other.y)
 
 
 class Color(NamedTuple):
@@ -228,7 +235,7 @@ class Color(NamedTuple):
     
     def to_hex(self) -> str:
         """Convert to HEX"""
-        return f"#{self.red:02x}{self.green:02x}{self.blue:02x}"
+        return "#" + bytes((self.red, self.green, self.blue)).hex()
 
 
 # 6. DATACLASS WITH ADVANCED TYPING
@@ -258,26 +265,22 @@ class Order:
     """Order"""
     id: int
     user_id: int
-    products: List[Product]
+    products: Dict[int, Product] = field(default_factory=dict)  # product.id -> Product, keeps insertion order
     status: Status = Status.PENDING
     created_at: Optional[str] = None
     
     @property
     def total_price(self) -> float:
         """Total order price"""
-        return sum(product.price for product in self.products)
+        return sum(product.price for product in self.products.values())
     
     def add_product(self, product: Product) -> None:
         """Add product"""
-        self.products.append(product)
+        self.products[product.id] = product
     
     def remove_product(self, product_id: int) -> bool:
         """Remove product by ID"""
-        for i, product in enumerate(self.products):
-            if product.id == product_id:
-                del self.products[i]
-                return True
-        return False
+        return self.products.pop(product_id, None) is not None
 
 
 # 7. FUNCTIONS WITH ADVANCED TYPING
@@ -297,11 +300,10 @@ def process_items(
     Returns:
         List of processed items
     """
-    filtered_items = items
-    if filter_func:
-        filtered_items = [item for item in items if filter_func(item)]
-    
-    return [processor(item) for item in filtered_items]
+    # Single pass: filter and process in one comprehension, no intermediate list
+    if filter_func is None:
+        return [processor(item) for item in items]
+    return [processor(item) for item in items if filter_func(item)]
 
 
 def create_cache_factory() -> Callable[[], Cache[str, Any]]:
@@ -337,6 +339,8 @@ def get_user_info(user_id: ID) -> UserDict:
 # 8. ASYNC TYPES
 async def fetch_data(url: str) -> Dict[str, Any]:
     """Async data fetching"""
+    import asyncio  # Imported lazily: only the async examples need it
+    
     # Simulate HTTP request
     await asyncio.sleep(0.1)
     return {"url": url, "status": "success"}
@@ -350,20 +354,25 @@ async def process_urls(urls: List[str]) -> AsyncGenerator[Dict[str, Any], None]:
 
 
 # 9. FUNCTIONS FOR WORKING WITH TYPES
-def analyze_type(obj: Any) -> Dict[str, Any]:
-    """Analyze object type"""
-    obj_type = type(obj)
-    
+@functools.lru_cache(maxsize=256)
+def _type_meta(obj_type: type) -> Dict[str, Any]:
+    """Type metadata, computed once per type (MRO walk is the expensive part)"""
     return {
         "type": obj_type.__name__,
         "module": obj_type.__module__,
-        "mro": [cls.__name__ for cls in obj_type.__mro__],
+        "mro": tuple(cls.__name__ for cls in obj_type.__mro__),
         "is_generic": hasattr(obj_type, "__origin__"),
         "origin": getattr(obj_type, "__origin__", None),
         "args": getattr(obj_type, "__args__", ()),
     }
 
 
+def analyze_type(obj: Any) -> Dict[str, Any]:
+    """Analyze object type"""
+    # Copy so callers can't modify the cached entry
+    return dict(_type_meta(type(obj)))
+
+
 def validate_protocol(obj: Any, protocol: type) -> bool:
     """Check if object conforms to protocol"""
     return isinstance(obj, protocol)
@@ -428,7 +437,8 @@ def demo_type_hints() -> None:
     print(f"Color: {color.to_hex()}")
     
     product = Product(1, "Laptop", 50000.0, "Electronics", ["computer", "work"])
-    order = Order(1, 123, [product])
+    order = Order(1, 123)
+    order.add_product(product)
     print(f"Order total: {order.total_price}")
     print()
     
@@ -463,6 +473,8 @@ async def demo_async_types() -> None:
 
 
 if __name__ == "__main__":
+    import asyncio
+    
     demo_type_hints()
     print("\n" + "="*50)
     asyncio.run(demo_async_types())
\ No newline at end of file
@@ -10,13 +10,14 @@ from pathlib import Path
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from localization_utils import LocalizationInfrastructure
-
 
 def demo_safe_modification():
     """Demonstrate safe file modification with backup and validation."""
     print("=== Localization Infrastructure Demo ===\n")
     
+    # Imported here so loading this module doesn't pull in backup/validator/detector
+    from localization_utils import LocalizationInfrastructure
+    
     # Initialize infrastructure
     infra = LocalizationInfrastructure()
     
@@ -4,56 +4,91 @@ Language detection utility for localization process.
 Detects the language of text content to verify localization progress.
 """
 
+import ast
+import io
 import re
 import string
+import tokenize
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Tuple
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from localization_backup import IO_WORKERS, iter_files
+
+
+# Detection is statistical, so the word and pattern analysis only sees the
+# start of large files (plus the first cyrillic passage found further in)
+MAX_SAMPLE_CHARS = 64 * 1024
+
+# Patterns compiled once at import and shared by all detectors
+_RE_CODE_BLOCK = re.compile(r'```.*?```', re.DOTALL)
+_RE_INLINE_CODE = re.compile(r'`[^`]+`')
+_RE_URL = re.compile(r'https?://\S+')
+_RE_WORD = re.compile(r'\b\w{3,}\b')  # Words of three or more characters
+_RE_COMMENT = re.compile(r'#\s*(.+)')
+_RE_PY_DOCSTRING = re.compile(r'"""(.*?)"""', re.DOTALL)
+_RE_CYRILLIC = re.compile('[\u0400-\u04FF]')
+
+# AST nodes that can carry a docstring
+_DOCSTRING_NODES = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Tokens after which a string literal starts a new statement (i.e. a docstring)
+_LINE_START_TOKENS = frozenset({tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT})
+
+# All byte values except ASCII letters, for deleting with bytes.translate
+_NON_LATIN_BYTES = bytes(sorted(set(range(256)) - set(string.ascii_letters.encode())))
+
+
+class _PunctTable(dict):
+    """Translation table mapping punctuation and symbols to spaces.
+    
+    Entries are filled in on first lookup, so only code points that actually
+    occur in analyzed text are ever classified.
+    """
+    
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        value = char if char.isalnum() or char.isspace() or char == '_' else ' '
+        self[code] = value
+        return value
+
+
+_PUNCT_TABLE = _PunctTable()
+
+# Common function words for each language. Only words longer than two letters
+# are listed, since shorter ones are filtered out by _extract_words.
+# Numerals and other words without strong discriminating value are left out.
+RUSSIAN_STOPWORDS = frozenset({
+    'быть', 'что', 'это', 'она', 'они', 'как', 'который', 'свой', 'так',
+    'этот', 'ещё', 'такой', 'только', 'себя', 'своё', 'какой', 'когда', 'уже', 'для',
+    'вот', 'кто', 'мой', 'или', 'если', 'нет', 'самый', 'даже', 'другой', 'наш', 'свои',
+    'под', 'где', 'есть', 'сам', 'чтобы', 'там', 'чем', 'тут', 'ничто', 'потом', 'очень',
+    'при', 'надо', 'без', 'теперь', 'тоже', 'сейчас', 'можно', 'после', 'здесь', 'через',
+    'хорошо', 'каждый', 'тогда', 'просто', 'конечно', 'вдруг', 'над', 'никто',
+})
+
+ENGLISH_STOPWORDS = frozenset({
+    'the', 'and', 'that', 'have', 'for', 'not', 'with', 'you', 'this', 'but', 'his',
+    'from', 'they', 'her', 'she', 'will', 'all', 'would', 'there', 'their', 'what',
+    'out', 'about', 'who', 'which', 'when', 'can', 'just', 'him', 'into', 'your',
+    'some', 'could', 'them', 'other', 'than', 'then', 'now', 'only', 'its', 'over',
+    'also', 'after', 'how', 'our', 'well', 'even', 'because', 'any', 'these', 'most',
+    'very', 'here', 'more', 'been', 'down', 'did', 'may',
+})
 
 
 class LanguageDetector:
     """Detects language of text content using character patterns and common words."""
     
+    # Shared, immutable lookup data (built once per process, not per detector)
+    russian_words: ClassVar[FrozenSet[str]] = RUSSIAN_STOPWORDS
+    english_words: ClassVar[FrozenSet[str]] = ENGLISH_STOPWORDS
+    
     def __init__(self):
-        """Initialize language detector with pattern dictionaries."""
-        # Common Russian words and patterns
-        self.russian_words = {
-            'и', 'в', 'не', 'на', 'я', 'быть', 'он', 'с', 'что', 'а', 'по', 'это', 'она', 'к', 'но',
-            'они', 'мы', 'как', 'из', 'у', 'который', 'то', 'за', 'свой', 'что', 'её', 'так', 'вы',
-            'сказать', 'этот', 'один', 'ещё', 'бы', 'такой', 'только', 'себя', 'своё', 'какой',
-            'когда', 'уже', 'для', 'вот', 'кто', 'да', 'говорить', 'год', 'знать', 'мой', 'до',
-            'или', 'если', 'время', 'рука', 'нет', 'самый', 'ни', 'стать', 'большой', 'даже',
-            'другой', 'наш', 'свои', 'ну', 'под', 'где', 'дело', 'есть', 'сам', 'раз', 'чтобы',
-            'два', 'там', 'чем', 'глаз', 'жизнь', 'первый', 'день', 'тут', 'во', 'ничто', 'потом',
-            'очень', 'со', 'хотеть', 'ли', 'при', 'голова', 'надо', 'без', 'видеть', 'идти',
-            'теперь', 'тоже', 'стоять', 'друг', 'дом', 'сейчас', 'можно', 'после', 'слово',
-            'здесь', 'думать', 'место', 'спросить', 'через', 'работа', 'три', 'хорошо', 'новый',
-            'жить', 'старый', 'хороший', 'каждый', 'правда', 'тогда', 'просто', 'нога', 'сидеть',
-            'понять', 'иметь', 'конечно', 'делать', 'вдруг', 'над', 'взять', 'никто', 'сделать'
-        }
-        
-        # Common English words
-        self.english_words = {
-            'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i', 'it', 'for', 'not',
-            'on', 'with', 'he', 'as', 'you', 'do', 'at', 'this', 'but', 'his', 'by', 'from',
-            'they', 'we', 'say', 'her', 'she', 'or', 'an', 'will', 'my', 'one', 'all', 'would',
-            'there', 'their', 'what', 'so', 'up', 'out', 'if', 'about', 'who', 'get', 'which',
-            'go', 'me', 'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him', 'know',
-            'take', 'people', 'into', 'year', 'your', 'good', 'some', 'could', 'them', 'see',
-            'other', 'than', 'then', 'now', 'look', 'only', 'come', 'its', 'over', 'think',
-            'also', 'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well',
-            'way', 'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day', 'most',
-            'us', 'is', 'water', 'long', 'very', 'after', 'call', 'man', 'here', 'old',
-            'see', 'him', 'two', 'more', 'go', 'no', 'way', 'could', 'my', 'than', 'first',
-            'been', 'call', 'who', 'oil', 'sit', 'now', 'find', 'down', 'day', 'did', 'get',
-            'come', 'made', 'may', 'part'
-        }
-        
-        # Cyrillic character range
-        self.cyrillic_pattern = re.compile(r'[а-яё]', re.IGNORECASE)
-        
-        # Latin character range (excluding numbers and punctuation)
-        self.latin_pattern = re.compile(r'[a-z]', re.IGNORECASE)
+        """Initialize language detector."""
+        # Per-session results: path -> (mtime_ns, size, result)
+        self._file_cache: Dict[str, Tuple[int, int, Dict[str, any]]] = {}
     
     def detect_text_language(self, text: str) -> Tuple[str, float]:
         """Detect language of text content.
@@ -75,9 +110,11 @@ class LanguageDetector:
         if not clean_text:
             return 'unknown', 0.0
         
-        # Count character types
-        cyrillic_chars = len(self.cyrillic_pattern.findall(clean_text))
-        latin_chars = len(self.latin_pattern.findall(clean_text))
+        # Count character types on the UTF-8 bytes with C-level bytes methods:
+        # every cyrillic letter (U+0400-U+047F) starts with lead byte 0xD0 or 0xD1
+        encoded = clean_text.encode('utf-8')
+        cyrillic_chars = encoded.count(b'\xd0') + encoded.count(b'\xd1')
+        latin_chars = len(encoded.translate(None, _NON_LATIN_BYTES))
         total_chars = cyrillic_chars + latin_chars
         
         if total_chars == 0:
@@ -88,9 +125,15 @@ class LanguageDetector:
         latin_ratio = latin_chars / total_chars
         
         # Word-based detection
+        # (words are already lowercased; count each distinct word once,
+        # then intersect with the word sets instead of testing every word)
         words = self._extract_words(clean_text)
-        russian_word_count = sum(1 for word in words if word.lower() in self.russian_words)
-        english_word_count = sum(1 for word in words if word.lower() in self.english_words)
+        word_counts = Counter(words)
+        russian_word_count = (
+            sum(word_counts[word] for word in self.russian_words & word_counts.keys())
+            if cyrillic_chars else 0
+        )
+        english_word_count = sum(word_counts[word] for word in self.english_words & word_counts.keys())
         
         # Combine character and word analysis
         russian_score = cyrillic_ratio * 0.7 + (russian_word_count / max(len(words), 1)) * 0.3
@@ -106,18 +149,20 @@ class LanguageDetector:
         else:
             return 'unknown', max(russian_score, english_score)
     
-    def detect_file_language(self, file_path: str) -> Dict[str, any]:
+    def detect_file_language(self, file_path: str, refresh: bool = False) -> Dict[str, any]:
         """Detect language of file content.
         
         Args:
             file_path: Path to file to analyze
+            refresh: Analyze the file again even if its mtime and size are
+                unchanged (for callers that know the content changed)
             
         Returns:
             Dictionary with analysis results
         """
-        path = Path(file_path)
-        
-        if not path.exists():
+        try:
+            stat = Path(file_path).stat()
+        except FileNotFoundError:
             return {
                 'file': file_path,
                 'error': 'File not found',
@@ -125,13 +170,27 @@ class LanguageDetector:
                 'confidence': 0.0
             }
         
+        # Reuse the previous result while the file is unchanged. A rewrite
+        # within one timestamp tick that keeps the size looks unchanged here,
+        # which is what refresh is for
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = None if refresh else self._file_cache.get(file_path)
+        if cached is not None and cached[:2] == version:
+            return dict(cached[2])
+        
+        result = self._analyze_file(file_path)
+        self._file_cache[file_path] = (*version, result)
+        return dict(result)
+    
+    def _analyze_file(self, file_path: str) -> Dict[str, any]:
+        """Read a file and detect the language of its text content."""
         try:
             # Read file content
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
             # Extract text content based on file type
-            text_content = self._extract_text_content(content, path.suffix)
+            text_content = self._extract_text_content(self._sample(content), Path(file_path).suffix)
             
             # Detect language
             language, confidence = self.detect_text_language(text_content)
@@ -152,6 +211,26 @@ class LanguageDetector:
                 'confidence': 0.0
             }
     
+    @staticmethod
+    def _sample(content: str) -> str:
+        """Part of a file given to the word and pattern analysis.
+        
+        The first MAX_SAMPLE_CHARS characters; if cyrillic appears only
+        later, the stretch starting at that line is appended, so a Russian
+        comment deep in a large file is not missed.
+        """
+        if len(content) <= MAX_SAMPLE_CHARS:
+            return content
+        
+        sample = content[:MAX_SAMPLE_CHARS]
+        if _RE_CYRILLIC.search(sample) is None:
+            # Cheap C-level scan of the rest of the file
+            match = _RE_CYRILLIC.search(content, MAX_SAMPLE_CHARS)
+            if match is not None:
+                line_start = content.rfind('\n', MAX_SAMPLE_CHARS, match.start()) + 1 or MAX_SAMPLE_CHARS
+                sample += content[line_start:line_start + MAX_SAMPLE_CHARS]
+        return sample
+    
     def analyze_directory(self, dir_path: str, extensions: Optional[List[str]] = None) -> List[Dict[str, any]]:
         """Analyze language of all files in directory.
         
@@ -167,50 +246,102 @@ class LanguageDetector:
         if not path.exists():
             return [{'error': f'Directory not found: {dir_path}'}]
         
-        results = []
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
-                if extensions is None or file_path.suffix in extensions:
-                    result = self.detect_file_language(str(file_path))
-                    results.append(result)
+        file_list = list(iter_files(dir_path, extensions))
         
-        return results
+        # Read and analyze files concurrently to overlap disk latency
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            return list(executor.map(self.detect_file_language, file_list))
     
     def _clean_text(self, text: str) -> str:
         """Clean text for language analysis."""
         # Remove code blocks, URLs, and technical content
-        text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)  # Code blocks
-        text = re.sub(r'`[^`]+`', '', text)  # Inline code
-        text = re.sub(r'https?://\S+', '', text)  # URLs
-        text = re.sub(r'[^\w\s]', ' ', text)  # Remove punctuation
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
+        text = _RE_CODE_BLOCK.sub('', text)  # Code blocks
+        text = _RE_INLINE_CODE.sub('', text)  # Inline code
+        text = _RE_URL.sub('', text)  # URLs
+        text = text.translate(_PUNCT_TABLE)  # Remove punctuation
         
-        return text.strip()
+        return ' '.join(text.split())  # Normalize whitespace
     
     def _extract_words(self, text: str) -> List[str]:
         """Extract words from text."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        return [word for word in words if len(word) > 2]  # Filter short words
+        return _RE_WORD.findall(text.lower())  # Short words are skipped by the pattern
+    
+    def _extract_python_text(self, content: str) -> str:
+        """Extract docstrings and comments from Python source.
+        
+        Only human-language text is collected; other string literals are
+        mostly identifiers, format strings and URLs, which would skew detection.
+        """
+        tree = ast.parse(content)
+        
+        # Module, class and function docstrings
+        text_parts = [
+            docstring for node in ast.walk(tree)
+            if isinstance(node, _DOCSTRING_NODES) and (docstring := ast.get_docstring(node, clean=False))
+        ]
+        
+        # Comments
+        text_parts.extend(
+            token.string[1:].strip()
+            for token in tokenize.generate_tokens(io.StringIO(content).readline)
+            if token.type == tokenize.COMMENT
+        )
+        
+        return ' '.join(text_parts)
+    
+    def _extract_python_tokens(self, content: str) -> str:
+        """Extract docstrings and comments token by token.
+        
+        Used for sources that don't parse as a whole (e.g. a truncated
+        sample); text from tokens before a tokenizer error is kept. A string
+        that starts a logical line is taken to be a docstring.
+        """
+        text_parts = []
+        previous_type = tokenize.NEWLINE
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(content).readline):
+                if token.type == tokenize.COMMENT:
+                    text_parts.append(token.string[1:].strip())
+                    continue
+                if token.type == tokenize.NL:
+                    continue
+                if token.type == tokenize.STRING and previous_type in _LINE_START_TOKENS:
+                    prefix_end = len(token.string) - len(token.string.lstrip('rRbBuUfF'))
+                    body = token.string[prefix_end:]
+                    if 'b' not in token.string[:prefix_end].lower():  # Skip bytes literals
+                        quote_len = 3 if body[:3] in ('"""', "'''") else 1
+                        text_parts.append(body[quote_len:-quote_len])
+                previous_type = token.type
+        except (SyntaxError, tokenize.TokenError):
+            if not text_parts:
+                raise
+        
+        return ' '.join(text_parts)
     
     def _extract_text_content(self, content: str, file_extension: str) -> str:
         """Extract text content from file based on type."""
         if file_extension == '.py':
+            try:
+                return self._extract_python_text(content)
+            except (SyntaxError, tokenize.TokenError):
+                pass  # Not valid Python - fall back to the tokenizer
+            
+            try:
+                return self._extract_python_tokens(content)
+            except (SyntaxError, tokenize.TokenError):
+                pass  # Not even tokenizable - fall back to regex extraction
+            
             # Extract comments and docstrings
             text_parts = []
             
             # Single line comments
-            comments = re.findall(r'#\s*(.+)', content)
+            comments = _RE_COMMENT.findall(content)
             text_parts.extend(comments)
             
             # Docstrings
-            docstrings = re.findall(r'"""(.*?)"""', content, re.DOTALL)
+            docstrings = _RE_PY_DOCSTRING.findall(content)
             text_parts.extend(docstrings)
             
-            # String literals (basic extraction)
-            strings = re.findall(r'"([^"]+)"', content)
-            strings.extend(re.findall(r"'([^']+)'", content))
-            text_parts.extend(strings)
-            
             return ' '.join(text_parts)
         
         elif file_extension in ['.md', '.txt']:
@@ -219,17 +350,17 @@ class LanguageDetector:
         
         elif file_extension in ['.yml', '.yaml']:
             # YAML comments
-            comments = re.findall(r'#\s*(.+)', content)
+            comments = _RE_COMMENT.findall(content)
             return ' '.join(comments)
         
         elif file_extension == '.sh':
             # Shell script comments
-            comments = re.findall(r'#\s*(.+)', content)
+            comments = _RE_COMMENT.findall(content)
             return ' '.join(comments)
         
         else:
             # Default: extract comments
-            comments = re.findall(r'#\s*(.+)', content)
+            comments = _RE_COMMENT.findall(content)
             return ' '.join(comments)
 
 
@@ -7,8 +7,65 @@ Creates backups of files before modification to enable rollback if needed.
 import os
 import shutil
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, Iterator, List, Optional
+
+# Copying and reading files is I/O bound, so use more threads than cores
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Keeps output lines from concurrent backups from interleaving
+_print_lock = threading.Lock()
+
+
+def iter_files(root: str, extensions: Optional[List[str]] = None,
+               skip_dirs: FrozenSet[str] = frozenset()) -> Iterator[str]:
+    """Yield paths of all files under root, optionally filtered by extension.
+    
+    Directories whose name is in skip_dirs are not descended into.
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so no extra stat or Path object is needed per entry.
+    """
+    # Match the last suffix exactly (like Path.suffix); 'py' is accepted as '.py'
+    suffixes = frozenset(
+        ext if ext.startswith('.') else '.' + ext for ext in extensions
+    ) if extensions else None
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        stack.append(entry.path)
+                elif entry.is_file() and (suffixes is None or os.path.splitext(entry.name)[1] in suffixes):
+                    yield entry.path
+
+
+def copy_file(source: Path, destination: Path) -> None:
+    """Copy file contents and metadata (like shutil.copy2).
+    
+    Where available, os.copy_file_range copies inside the kernel, and can
+    reflink on filesystems that support it (btrfs, XFS). Falls back to
+    shutil.copyfile if the kernel call is unsupported for these files.
+    """
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            copied = remaining == 0
+        except OSError:
+            copied = False
+    
+    if not copied:
+        shutil.copyfile(source, destination)
+    shutil.copystat(source, destination)
 
 
 class LocalizationBackup:
@@ -25,6 +82,19 @@ class LocalizationBackup:
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self.session_dir = self.backup_dir / f"session_{self.timestamp}"
         self.session_dir.mkdir(exist_ok=True)
+        # Resolved once; per-file paths are made absolute lexically, without resolving
+        self._cwd = Path.cwd().resolve()
+        # Original paths backed up in this session (dict used as an ordered set)
+        self._backed_up: Dict[str, None] = {}
+    
+    def _relative_path(self, file_path: str) -> Path:
+        """Path of a file relative to the backup session directory."""
+        source_path = Path(os.path.abspath(file_path))
+        try:
+            return source_path.relative_to(self._cwd)
+        except ValueError:
+            # If file is not in current directory tree, use absolute path structure
+            return Path(*source_path.parts[1:])
     
     def backup_file(self, file_path: str) -> str:
         """Create backup of a single file.
@@ -35,25 +105,21 @@ class LocalizationBackup:
         Returns:
             Path to backup file
         """
-        source_path = Path(file_path).resolve()
+        source_path = Path(file_path)
         if not source_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
         # Create relative path structure in backup
-        try:
-            relative_path = source_path.relative_to(Path.cwd().resolve())
-        except ValueError:
-            # If file is not in current directory tree, use absolute path structure
-            relative_path = Path(*source_path.parts[1:]) if source_path.is_absolute() else source_path
-        
-        backup_path = self.session_dir / relative_path
+        backup_path = self.session_dir / self._relative_path(file_path)
         
         # Create parent directories
         backup_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Copy file
-        shutil.copy2(source_path, backup_path)
-        print(f"Backed up: {file_path} -> {backup_path}")
+        copy_file(source_path, backup_path)
+        self._backed_up[os.path.abspath(file_path)] = None
+        with _print_lock:
+            print(f"Backed up: {file_path} -> {backup_path}")
         
         return str(backup_path)
     
@@ -90,17 +156,22 @@ class LocalizationBackup:
         if not source_dir.exists():
             raise FileNotFoundError(f"Directory not found: {dir_path}")
         
-        backup_paths = []
-        for file_path in source_dir.rglob("*"):
-            if file_path.is_file():
-                if extensions is None or file_path.suffix in extensions:
-                    try:
-                        backup_path = self.backup_file(str(file_path))
-                        backup_paths.append(backup_path)
-                    except Exception as e:
-                        print(f"Failed to backup {file_path}: {e}")
+        file_list = list(iter_files(dir_path, extensions))
         
-        return backup_paths
+        # Copy files concurrently to overlap disk latency
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            results = list(executor.map(self._try_backup_file, file_list))
+        
+        return [backup_path for backup_path in results if backup_path is not None]
+    
+    def _try_backup_file(self, file_path: str) -> Optional[str]:
+        """Backup a file, reporting failure instead of raising."""
+        try:
+            return self.backup_file(file_path)
+        except Exception as e:
+            with _print_lock:
+                print(f"Failed to backup {file_path}: {e}")
+            return None
     
     def restore_file(self, original_path: str) -> bool:
         """Restore file from backup.
@@ -111,21 +182,15 @@ class LocalizationBackup:
         Returns:
             True if restored successfully
         """
-        source_path = Path(original_path).resolve()
-        try:
-            relative_path = source_path.relative_to(Path.cwd().resolve())
-        except ValueError:
-            # If file is not in current directory tree, use absolute path structure
-            relative_path = Path(*source_path.parts[1:]) if source_path.is_absolute() else Path(original_path)
-        
-        backup_path = self.session_dir / relative_path
+        source_path = Path(original_path)
+        backup_path = self.session_dir / self._relative_path(original_path)
         
         if not backup_path.exists():
             print(f"Backup not found: {backup_path}")
             return False
         
         try:
-            shutil.copy2(backup_path, source_path)
+            copy_file(backup_path, source_path)
             print(f"Restored: {backup_path} -> {original_path}")
             return True
         except Exception as e:
@@ -138,15 +203,7 @@ class LocalizationBackup:
         Returns:
             List of backed up file paths
         """
-        backup_files = []
-        for file_path in self.session_dir.rglob("*"):
-            if file_path.is_file():
-                # Convert back to original path
-                relative_path = file_path.relative_to(self.session_dir)
-                original_path = Path.cwd() / relative_path
-                backup_files.append(str(original_path))
-        
-        return backup_files
+        return list(self._backed_up)
 
 
 def main():
@@ -4,19 +4,34 @@ Main orchestration script for localization infrastructure.
 Provides unified interface for backup, validation, and language detection utilities.
 """
 
-import sys
+import hashlib
 import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from localization_backup import LocalizationBackup
+from localization_backup import LocalizationBackup, iter_files
 from syntax_validator import SyntaxValidator
 from language_detector import LanguageDetector
 
 
+# File types checked by validate_project_syntax
+VALIDATED_EXTENSIONS = ['.py', '.json', '.yml', '.yaml', '.md', '.sh', '.ps1']
+
+# Directories never descended into when validating a project
+SKIPPED_DIRS = frozenset({'localization_backups', '.git', '__pycache__', 'node_modules', '.venv'})
+
+
+def file_digest(file_path: str) -> bytes:
+    """Short content hash of a file, for detecting whether it changed."""
+    return hashlib.blake2b(Path(file_path).read_bytes(), digest_size=16).digest()
+
+
 class LocalizationInfrastructure:
     """Main orchestration class for localization infrastructure."""
     
@@ -30,13 +45,22 @@ class LocalizationInfrastructure:
         self.validator = SyntaxValidator()
         self.detector = LanguageDetector()
     
-    def safe_modify_file(self, file_path: str, modification_func, *args, **kwargs) -> Dict[str, any]:
+    def safe_modify_file(self, file_path: str, modification_func, *args,
+                         skip_postcheck_if_already_english: bool = False,
+                         language_hint: Optional[str] = None, **kwargs) -> Dict[str, any]:
         """Safely modify a file with backup and validation.
         
+        The work runs as a pipeline of stages (see MODIFY_STAGES); the first
+        stage that fails ends it, so later stages are never paid for.
+        
         Args:
             file_path: Path to file to modify
             modification_func: Function that modifies the file
             *args, **kwargs: Arguments for modification function
+            skip_postcheck_if_already_english: Don't re-detect the language of
+                files that were already English before the modification
+            language_hint: Language of the file before the modification, when
+                the caller already knows it (skips detecting it)
             
         Returns:
             Dictionary with operation results
@@ -50,38 +74,16 @@ class LocalizationInfrastructure:
             'language_after': 'unknown',
             'error': None
         }
+        options = {
+            'modify': lambda: modification_func(file_path, *args, **kwargs),
+            'skip_postcheck_if_already_english': skip_postcheck_if_already_english,
+            'language_hint': language_hint,
+        }
         
         try:
-            # Check if file exists
-            if not Path(file_path).exists():
-                result['error'] = 'File not found'
-                return result
-            
-            # Detect language before modification
-            lang_result = self.detector.detect_file_language(file_path)
-            result['language_before'] = lang_result.get('language', 'unknown')
-            
-            # Create backup
-            backup_path = self.backup.backup_file(file_path)
-            result['backup_created'] = True
-            result['backup_path'] = backup_path
-            
-            # Perform modification
-            modification_func(file_path, *args, **kwargs)
-            
-            # Validate syntax after modification
-            is_valid, error_msg = self.validator.validate_file(file_path)
-            result['validation_passed'] = is_valid
-            
-            if not is_valid:
-                # Restore from backup if validation fails
-                self.backup.restore_file(file_path)
-                result['error'] = f'Validation failed: {error_msg}. File restored from backup.'
-                return result
-            
-            # Detect language after modification
-            lang_result = self.detector.detect_file_language(file_path)
-            result['language_after'] = lang_result.get('language', 'unknown')
+            for stage in self.MODIFY_STAGES:
+                if not stage(self, file_path, result, options):
+                    return result
             
             result['success'] = True
             
@@ -97,22 +99,109 @@ class LocalizationInfrastructure:
         
         return result
     
-    def safe_modify_files(self, file_paths: List[str], modification_func, *args, **kwargs) -> List[Dict[str, any]]:
+    # Stages of safe_modify_file. Each updates the result dict and returns
+    # False to stop the pipeline.
+    
+    def _check_exists(self, file_path: str, result: Dict[str, any], options: Dict[str, any]) -> bool:
+        if not Path(file_path).exists():
+            result['error'] = 'File not found'
+            return False
+        return True
+    
+    def _snapshot_language(self, file_path: str, result: Dict[str, any], options: Dict[str, any]) -> bool:
+        if options['language_hint'] is not None:
+            result['language_before'] = options['language_hint']
+        else:
+            lang_result = self.detector.detect_file_language(file_path)
+            result['language_before'] = lang_result.get('language', 'unknown')
+        # Lets _recheck_language tell whether the modification changed anything
+        options['digest_before'] = file_digest(file_path)
+        return True
+    
+    def _backup(self, file_path: str, result: Dict[str, any], options: Dict[str, any]) -> bool:
+        result['backup_path'] = self.backup.backup_file(file_path)
+        result['backup_created'] = True
+        return True
+    
+    def _modify(self, file_path: str, result: Dict[str, any], options: Dict[str, any]) -> bool:
+        options['modify']()
+        return True
+    
+    def _validate(self, file_path: str, result: Dict[str, any], options: Dict[str, any]) -> bool:
+        if os.path.splitext(file_path)[1].lower() not in self.validator.validators:
+            # No validator for this file type, nothing to check
+            result['validation_passed'] = True
+            return True
+        
+        is_valid, error_msg = self.validator.validate_file(file_path)
+        result['validation_passed'] = is_valid
+        
+        if not is_valid:
+            # Restore from backup if validation fails
+            self.backup.restore_file(file_path)
+            result['error'] = f'Validation failed: {error_msg}. File restored from backup.'
+            return False
+        return True
+    
+    def _recheck_language(self, file_path: str, result: Dict[str, any], options: Dict[str, any]) -> bool:
+        if options['skip_postcheck_if_already_english'] and result['language_before'] == 'english':
+            result['language_after'] = 'english'
+            return True
+        
+        if file_digest(file_path) == options['digest_before']:
+            # Content unchanged, so is its language
+            result['language_after'] = result['language_before']
+            return True
+        
+        # The digests differ, so bypass the detector's mtime/size cache
+        lang_result = self.detector.detect_file_language(file_path, refresh=True)
+        result['language_after'] = lang_result.get('language', 'unknown')
+        return True
+    
+    MODIFY_STAGES = (_check_exists, _snapshot_language, _backup, _modify, _validate, _recheck_language)
+    
+    def safe_modify_files(self, file_paths: List[str], modification_func, *args,
+                          fail_fast: bool = False, max_workers: int = 1, **kwargs) -> List[Dict[str, any]]:
         """Safely modify multiple files with backup and validation.
         
+        Files are processed one at a time unless max_workers > 1, in which
+        case they run on a thread pool and modification_func must be safe to
+        call for different files at the same time.
+        
         Args:
             file_paths: List of file paths to modify
             modification_func: Function that modifies files
             *args, **kwargs: Arguments for modification function
+            fail_fast: Stop at the first unsuccessful file (in input order).
+                Files not yet started are skipped and left out of the results;
+                files already started on other threads are still reported.
+            max_workers: Number of files processed concurrently
             
         Returns:
-            List of operation results for each file
+            List of operation results for each processed file, in input order
         """
-        results = []
-        for file_path in file_paths:
-            result = self.safe_modify_file(file_path, modification_func, *args, **kwargs)
-            results.append(result)
-        return results
+        if max_workers <= 1:
+            results = []
+            for file_path in file_paths:
+                result = self.safe_modify_file(file_path, modification_func, *args, **kwargs)
+                results.append(result)
+                if fail_fast and not result['success']:
+                    break
+            return results
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.safe_modify_file, file_path, modification_func, *args, **kwargs)
+                for file_path in file_paths
+            ]
+            for future in futures:
+                if fail_fast and not future.result()['success']:
+                    # cancel() only succeeds for files that haven't started
+                    for pending in futures:
+                        pending.cancel()
+                    break
+            # Everything that ran (including files modified after the failure) is reported
+            return [future.result() for future in futures if not future.cancelled()]
     
     def analyze_localization_progress(self, directory: str, extensions: Optional[List[str]] = None) -> Dict[str, any]:
         """Analyze localization progress in a directory.
@@ -126,12 +215,17 @@ class LocalizationInfrastructure:
         """
         results = self.detector.analyze_directory(directory, extensions)
         
-        # Calculate statistics
-        total_files = len([r for r in results if 'error' not in r])
-        russian_files = len([r for r in results if r.get('language') == 'russian'])
-        english_files = len([r for r in results if r.get('language') == 'english'])
-        mixed_files = len([r for r in results if r.get('language') == 'mixed'])
-        unknown_files = len([r for r in results if r.get('language') == 'unknown'])
+        # Calculate statistics in a single pass
+        total_files = 0
+        language_counts = Counter()
+        for r in results:
+            if 'error' not in r:
+                total_files += 1
+            language_counts[r.get('language')] += 1
+        russian_files = language_counts['russian']
+        english_files = language_counts['english']
+        mixed_files = language_counts['mixed']
+        unknown_files = language_counts['unknown']
         
         progress = {
             'directory': directory,
@@ -156,24 +250,11 @@ class LocalizationInfrastructure:
         Returns:
             Dictionary with validation results
         """
-        # Define file patterns to validate
-        extensions = ['.py', '.json', '.yml', '.yaml', '.md', '.sh', '.ps1']
-        
-        # Find all files to validate
-        files_to_validate = []
-        for ext in extensions:
-            pattern = f"**/*{ext}"
-            files_to_validate.extend(Path(project_root).glob(pattern))
-        
-        # Convert to strings and filter out backup directories
-        file_paths = []
-        for file_path in files_to_validate:
-            str_path = str(file_path)
-            if 'localization_backups' not in str_path and '.git' not in str_path:
-                file_paths.append(str_path)
+        # Find all files to validate in a single walk, skipping backups and git data
+        file_paths = list(iter_files(project_root, VALIDATED_EXTENSIONS, SKIPPED_DIRS))
         
         # Validate all files
-        validation_results = self.validator.validate_files(file_paths)
+        validation_results = self.validator.validate_files_parallel(file_paths)
         
         # Calculate statistics
         total_files = len(validation_results)
@@ -6,27 +6,265 @@ Validates file syntax after modifications to ensure no syntax errors were introd
 
 import ast
 import json
-import yaml
-import subprocess
+import os
+import shutil
 import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple
+
+
+# Validated by an external process, so threads are enough to run them concurrently
+SUBPROCESS_EXTENSIONS = frozenset({'.sh', '.ps1'})
+
+# Checks each script given as an argument with `bash -n`, printing
+# NUL-separated "path, error" pairs for the ones that fail
+_SHELL_BATCH_SCRIPT = (
+    'for f; do if ! out=$(bash -n -- "$f" 2>&1); then printf "%s\\0%s\\0" "$f" "$out"; fi; done'
+)
+
+# Scripts checked per bash invocation (keeps the command line well below ARG_MAX)
+SHELL_BATCH_SIZE = 500
+
+# Parses each NUL-separated path read from stdin with PowerShell's own parser
+# (no code is run), printing NUL-separated "path, errors" pairs for the ones
+# that fail. Paths come through stdin to avoid quoting and command line limits.
+_POWERSHELL_BATCH_SCRIPT = (
+    '$utf8 = [Text.UTF8Encoding]::new($false); [Console]::OutputEncoding = $utf8; '
+    'try { [Console]::InputEncoding = $utf8 } catch { }; '
+    'foreach ($f in [Console]::In.ReadToEnd().Split([char]0)) { '
+    'if (-not $f) { continue }; $errors = $null; '
+    'try { [void][System.Management.Automation.Language.Parser]::ParseFile($f, [ref]$null, [ref]$errors) } '
+    'catch { [Console]::Out.Write($f + [char]0 + $_.Exception.Message + [char]0); continue }; '
+    'if ($errors) { [Console]::Out.Write($f + [char]0 + (($errors | ForEach-Object '
+    '{ "line $($_.Extent.StartLineNumber): $($_.Message)" }) -join "`n") + [char]0) } }'
+)
+
+# orjson parses several times faster than the stdlib when it is installed
+try:
+    from orjson import loads as _fast_json_loads
+except ImportError:
+    _fast_json_loads = json.loads
+
+# PyYAML and its loader, imported by _yaml_module the first time a YAML file is validated
+_yaml = None
+_yaml_loader = None
+
+# Whether the interpreters behind the subprocess validators are installed
+HAVE_BASH = shutil.which('bash') is not None
+POWERSHELL = shutil.which('pwsh') or shutil.which('powershell')
+HAVE_POWERSHELL = POWERSHELL is not None
+
+# File types whose validators accept prefetched bytes
+PREFETCHED_EXTENSIONS = frozenset({'.py', '.json', '.yml', '.yaml', '.md'})
+
+# Files read ahead of the one being parsed
+PREFETCH_DEPTH = 2
+
+# Maximum number of cached validation results
+VALIDATION_CACHE_SIZE = 50_000
+
+# Default location of the persistent validation cache
+CACHE_FILE = '.localization_cache.json'
+
+
+def _yaml_module():
+    """Import PyYAML on first use (projects without YAML never pay for it)."""
+    global _yaml, _yaml_loader
+    if _yaml is None:
+        import yaml
+        # libyaml-based safe loader when PyYAML was built with it
+        _yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        _yaml = yaml
+    return _yaml
+
+
+def _validate_noop(file_path: str, data: Optional[bytes] = None) -> Tuple[bool, Optional[str]]:
+    """Accept the file unchecked (its validator's interpreter is not installed)."""
+    return True, None
+
+
+def _validate_python(file_path: str, data: Optional[bytes] = None) -> Tuple[bool, Optional[str]]:
+    """Validate Python file syntax."""
+    try:
+        # Parse AST to check syntax (bytes input, decoded by the parser itself)
+        ast.parse(data if data is not None else Path(file_path).read_bytes(), filename=file_path)
+        return True, None
+        
+    except SyntaxError as e:
+        return False, f"Python syntax error: {e.msg} at line {e.lineno}"
+    except Exception as e:
+        return False, f"Python validation error: {str(e)}"
+
+
+def _validate_json(file_path: str, data: Optional[bytes] = None) -> Tuple[bool, Optional[str]]:
+    """Validate JSON file syntax."""
+    try:
+        raw = data if data is not None else Path(file_path).read_bytes()
+        try:
+            _fast_json_loads(raw)
+        except ValueError:
+            # orjson is stricter (e.g. 64-bit integer limit); let the
+            # stdlib parser decide and report the error
+            json.loads(raw)
+        return True, None
+        
+    except json.JSONDecodeError as e:
+        return False, f"JSON syntax error: {e.msg} at line {e.lineno}"
+    except Exception as e:
+        return False, f"JSON validation error: {str(e)}"
+
+
+def _validate_yaml(file_path: str, data: Optional[bytes] = None) -> Tuple[bool, Optional[str]]:
+    """Validate YAML file syntax."""
+    yaml = _yaml_module()
+    try:
+        # Handle multi-document YAML files (common in Kubernetes). Composing
+        # checks syntax without constructing Python objects, and the
+        # zero-length deque discards each node as soon as it is built.
+        deque(yaml.compose_all(data if data is not None else Path(file_path).read_bytes(),
+                               Loader=_yaml_loader), maxlen=0)
+        # If we got here without exception, YAML is valid
+        return True, None
+        
+    except yaml.YAMLError as e:
+        return False, f"YAML syntax error: {str(e)}"
+    except Exception as e:
+        return False, f"YAML validation error: {str(e)}"
+
+
+def _validate_markdown(file_path: str, data: Optional[bytes] = None) -> Tuple[bool, Optional[str]]:
+    """Validate Markdown file (basic check for UTF-8 encoding)."""
+    try:
+        (data if data is not None else Path(file_path).read_bytes()).decode('utf-8')
+        return True, None
+        
+    except UnicodeDecodeError as e:
+        return False, f"Markdown encoding error: {str(e)}"
+    except Exception as e:
+        return False, f"Markdown validation error: {str(e)}"
+
+
+def _validate_shell(file_path: str) -> Tuple[bool, Optional[str]]:
+    """Validate shell script syntax using bash -n."""
+    import subprocess
+    try:
+        result = subprocess.run(
+            ['bash', '-n', file_path],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        
+        if result.returncode == 0:
+            return True, None
+        else:
+            return False, f"Shell syntax error: {result.stderr.strip()}"
+            
+    except subprocess.TimeoutExpired:
+        return False, "Shell validation timeout"
+    except FileNotFoundError:
+        # bash not available, skip validation
+        return True, None
+    except Exception as e:
+        return False, f"Shell validation error: {str(e)}"
+
+
+def _validate_powershell(file_path: str) -> Tuple[bool, Optional[str]]:
+    """Validate PowerShell script syntax."""
+    return _validate_powershell_batch([file_path])[file_path]
+
+
+def _validate_powershell_batch(file_paths: List[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+    """Validate PowerShell scripts with a single PowerShell process.
+    
+    Uses the System.Management.Automation.Language.Parser API, so a script
+    is rejected exactly when PowerShell itself could not parse it.
+    """
+    import subprocess
+    if not file_paths:
+        return {}
+    try:
+        result = subprocess.run(
+            [POWERSHELL or 'powershell', '-NoProfile', '-NonInteractive', '-Command', _POWERSHELL_BATCH_SCRIPT],
+            input='\0'.join(file_paths).encode('utf-8'),
+            capture_output=True,
+            timeout=10 + len(file_paths)
+        )
+    except subprocess.TimeoutExpired:
+        return dict.fromkeys(file_paths, (False, "PowerShell validation timeout"))
+    except FileNotFoundError:
+        # PowerShell not available, skip validation
+        return dict.fromkeys(file_paths, (True, None))
+    except Exception as e:
+        return dict.fromkeys(file_paths, (False, f"PowerShell validation error: {str(e)}"))
+    
+    if result.returncode != 0:
+        error = result.stderr.decode('utf-8', errors='replace').strip()
+        return dict.fromkeys(file_paths, (False, f"PowerShell validation error: {error}"))
+    
+    fields = result.stdout.decode('utf-8', errors='replace').split('\0')
+    failures = dict(zip(fields[0::2], fields[1::2]))
+    results = {}
+    for file_path in file_paths:
+        if file_path in failures:
+            results[file_path] = False, f"PowerShell syntax error: {failures[file_path].strip()}"
+        else:
+            results[file_path] = True, None
+    return results
+
+
+# Validator for each supported file extension
+VALIDATORS = {
+    '.py': _validate_python,
+    '.json': _validate_json,
+    '.yml': _validate_yaml,
+    '.yaml': _validate_yaml,
+    '.md': _validate_markdown,
+    '.sh': _validate_shell if HAVE_BASH else _validate_noop,
+    '.ps1': _validate_powershell if HAVE_POWERSHELL else _validate_noop,
+}
+
+
+def _extension(file_path: str) -> str:
+    """Lowercased file extension (string-based, no Path object)."""
+    return os.path.splitext(file_path)[1].lower()
+
+
+# Validator used by worker processes of validate_files_parallel
+_worker_validator = None
+
+
+def _validate_one(file_path: str) -> Tuple[bool, Optional[str]]:
+    """Validate a file in a worker process (module-level so it can be pickled)."""
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = SyntaxValidator()
+    return _worker_validator._validate_uncached(file_path)
 
 
 class SyntaxValidator:
     """Validates syntax of various file types after localization."""
     
-    def __init__(self):
-        """Initialize syntax validator."""
-        self.validators = {
-            '.py': self._validate_python,
-            '.json': self._validate_json,
-            '.yml': self._validate_yaml,
-            '.yaml': self._validate_yaml,
-            '.md': self._validate_markdown,
-            '.sh': self._validate_shell,
-            '.ps1': self._validate_powershell,
-        }
+    # Shared extension -> validator table
+    validators: ClassVar[Dict[str, Callable[..., Tuple[bool, Optional[str]]]]] = VALIDATORS
+    
+    def __init__(self, persistent: bool = False, cache_file: str = CACHE_FILE):
+        """Initialize syntax validator.
+        
+        Args:
+            persistent: Keep validation results in cache_file between runs
+            cache_file: Path of the persistent results cache
+        """
+        # Results keyed by (path, mtime_ns, size), least recently used first
+        self._validation_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()  # validate_file may be called from several threads
+        self._cache_file = Path(cache_file) if persistent else None
+        if self._cache_file is not None:
+            self._load_cache()
     
     def validate_file(self, file_path: str) -> Tuple[bool, Optional[str]]:
         """Validate syntax of a single file.
@@ -37,22 +275,18 @@ class SyntaxValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        path = Path(file_path)
-        
-        if not path.exists():
+        # The stat for the cache key doubles as the existence check
+        key = self._cache_key(file_path)
+        if key is None:
             return False, f"File not found: {file_path}"
         
-        extension = path.suffix.lower()
-        validator = self.validators.get(extension)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         
-        if validator is None:
-            # No specific validator, assume valid
-            return True, None
-        
-        try:
-            return validator(file_path)
-        except Exception as e:
-            return False, f"Validation error: {str(e)}"
+        result = self._run_validator(file_path)
+        self._cache_put(key, result)
+        return result
     
     def validate_files(self, file_paths: List[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
         """Validate syntax of multiple files.
@@ -63,109 +297,262 @@ class SyntaxValidator:
         Returns:
             Dictionary mapping file paths to validation results
         """
+        # Shell scripts are checked in batches to avoid one bash start per file
+        shell_paths = [
+            file_path for file_path in self._scripts(file_paths, '.sh')
+            if self._cache_get(self._cache_key(file_path)) is None
+        ]
+        for file_path, result in self._validate_shell_batch(shell_paths).items():
+            self._cache_put(self._cache_key(file_path), result)
+        
+        # Likewise all PowerShell scripts share one PowerShell process
+        powershell_paths = [
+            file_path for file_path in self._scripts(file_paths, '.ps1')
+            if self._cache_get(self._cache_key(file_path)) is None
+        ]
+        for file_path, result in _validate_powershell_batch(powershell_paths).items():
+            self._cache_put(self._cache_key(file_path), result)
+        
+        # Parse files whose validators take raw bytes while a background
+        # thread reads ahead, so disk reads overlap with parsing
+        prefetch_paths = []
+        for file_path in file_paths:
+            key = self._cache_key(file_path)
+            if (key is not None and self._cache_get(key) is None
+                    and _extension(file_path) in PREFETCHED_EXTENSIONS):
+                prefetch_paths.append((file_path, key))
+        
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            upcoming = iter(prefetch_paths)
+            in_flight = deque()
+            
+            def read_next():
+                item = next(upcoming, None)
+                if item is not None:
+                    in_flight.append((*item, reader.submit(Path(item[0]).read_bytes)))
+            
+            for _ in range(PREFETCH_DEPTH):
+                read_next()
+            while in_flight:
+                file_path, key, future = in_flight.popleft()
+                read_next()
+                self._cache_put(key, self._validate_prefetched(file_path, future))
+        
+        # Batched and prefetched files are now served from the cache
         results = {}
         for file_path in file_paths:
             results[file_path] = self.validate_file(file_path)
+        
+        self._save_cache()
         return results
     
-    def _validate_python(self, file_path: str) -> Tuple[bool, Optional[str]]:
-        """Validate Python file syntax."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+    def validate_files_parallel(self, file_paths: List[str], workers: Optional[int] = None,
+                                fail_fast: bool = False) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """Validate syntax of multiple files using all CPU cores.
+        
+        In-process parsers (Python, JSON, YAML, Markdown) run in a process pool;
+        shell and PowerShell checks, which wait on a subprocess, run in batches on a thread pool.
+        
+        Args:
+            file_paths: List of file paths to validate
+            workers: Number of workers per pool (defaults to CPU count)
+            fail_fast: Stop at the first invalid file in input order. Files
+                before it are always validated; files after it are left out
+                of the results, even if some of them were already checked.
             
-            # Parse AST to check syntax
-            ast.parse(content, filename=file_path)
-            return True, None
+        Returns:
+            Dictionary mapping file paths to validation results, in input order
+        """
+        # Deferred: importing it pulls in multiprocessing (and subprocess)
+        from concurrent.futures import ProcessPoolExecutor
+        
+        workers = workers or os.cpu_count() or 1
+        keys = {file_path: self._cache_key(file_path) for file_path in file_paths}
+        
+        # Unchanged files are answered from the cache; only the rest are dispatched.
+        # With fail_fast, nothing past the first invalid file (limit) is needed
+        limit = len(file_paths)
+        positions = {}
+        results = {}
+        pending = []
+        for position, file_path in enumerate(file_paths):
+            positions.setdefault(file_path, position)
+            cached = self._cache_get(keys[file_path])
+            if cached is None:
+                pending.append(file_path)
+            else:
+                results[file_path] = cached
+                if fail_fast and not cached[0]:
+                    limit = position
+                    break
+        outstanding = set(pending)
+        
+        parsed_paths = []
+        subprocess_paths = []
+        for file_path in pending:
+            if _extension(file_path) in SUBPROCESS_EXTENSIONS:
+                subprocess_paths.append(file_path)
+            else:
+                parsed_paths.append(file_path)
+        
+        # Shell scripts are split into one bash batch per worker thread;
+        # PowerShell scripts go to a single process, whose startup dominates
+        shell_paths = self._scripts(subprocess_paths, '.sh')
+        powershell_paths = self._scripts(subprocess_paths, '.ps1')
+        batched = set(shell_paths).union(powershell_paths)
+        subprocess_paths = [file_path for file_path in subprocess_paths if file_path not in batched]
+        shell_batch_size = min(SHELL_BATCH_SIZE, max(1, -(-len(shell_paths) // workers)))
+        shell_batches = [
+            shell_paths[start:start + shell_batch_size]
+            for start in range(0, len(shell_paths), shell_batch_size)
+        ]
+        
+        with ProcessPoolExecutor(max_workers=workers) as processes, \
+                ThreadPoolExecutor(max_workers=workers) as threads:
+            chunksize = max(1, len(parsed_paths) // (workers * 4))
+            parsed_results = processes.map(_validate_one, parsed_paths, chunksize=chunksize)
+            subprocess_results = threads.map(self._validate_uncached, subprocess_paths)
+            shell_results = threads.map(self._validate_shell_batch, shell_batches)
+            powershell_results = [threads.submit(_validate_powershell_batch, powershell_paths)]
             
-        except SyntaxError as e:
-            return False, f"Python syntax error: {e.msg} at line {e.lineno}"
-        except Exception as e:
-            return False, f"Python validation error: {str(e)}"
+            for file_path, result in chain(
+                zip(chain(parsed_paths, subprocess_paths), chain(parsed_results, subprocess_results)),
+                chain.from_iterable(batch.items() for batch in shell_results),
+                chain.from_iterable(future.result().items() for future in powershell_results)
+            ):
+                results[file_path] = result
+                self._cache_put(keys[file_path], result)
+                if fail_fast:
+                    # Results arrive in pool order, so keep going until every
+                    # file before the earliest invalid one has been checked
+                    outstanding.discard(file_path)
+                    if not result[0] and positions[file_path] < limit:
+                        limit = positions[file_path]
+                        outstanding = {path for path in outstanding if positions[path] < limit}
+                    if not outstanding:
+                        processes.shutdown(cancel_futures=True)
+                        threads.shutdown(cancel_futures=True)
+                        break
+        
+        self._save_cache()
+        return {file_path: results[file_path] for file_path in file_paths[:limit + 1] if file_path in results}
     
-    def _validate_json(self, file_path: str) -> Tuple[bool, Optional[str]]:
-        """Validate JSON file syntax."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json.load(f)
-            return True, None
-            
-        except json.JSONDecodeError as e:
-            return False, f"JSON syntax error: {e.msg} at line {e.lineno}"
-        except Exception as e:
-            return False, f"JSON validation error: {str(e)}"
+    def _validate_uncached(self, file_path: str) -> Tuple[bool, Optional[str]]:
+        """Validate a file without consulting the results cache."""
+        if not os.path.exists(file_path):
+            return False, f"File not found: {file_path}"
+        return self._run_validator(file_path)
     
-    def _validate_yaml(self, file_path: str) -> Tuple[bool, Optional[str]]:
-        """Validate YAML file syntax."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # Handle multi-document YAML files (common in Kubernetes)
-                documents = list(yaml.safe_load_all(f))
-                # If we got here without exception, YAML is valid
+    def _run_validator(self, file_path: str) -> Tuple[bool, Optional[str]]:
+        """Dispatch an existing file to the validator for its extension."""
+        validator = VALIDATORS.get(_extension(file_path))
+        
+        if validator is None:
+            # No specific validator, assume valid
             return True, None
-            
-        except yaml.YAMLError as e:
-            return False, f"YAML syntax error: {str(e)}"
+        
+        try:
+            return validator(file_path)
         except Exception as e:
-            return False, f"YAML validation error: {str(e)}"
+            return False, f"Validation error: {str(e)}"
     
-    def _validate_markdown(self, file_path: str) -> Tuple[bool, Optional[str]]:
-        """Validate Markdown file (basic check for UTF-8 encoding)."""
+    def _validate_prefetched(self, file_path: str, future: Future) -> Tuple[bool, Optional[str]]:
+        """Validate a file from bytes read in the background."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                f.read()
-            return True, None
-            
-        except UnicodeDecodeError as e:
-            return False, f"Markdown encoding error: {str(e)}"
+            data = future.result()
+        except OSError:
+            # Reading failed - let the regular path report it
+            return self._validate_uncached(file_path)
+        
+        try:
+            return VALIDATORS[_extension(file_path)](file_path, data)
         except Exception as e:
-            return False, f"Markdown validation error: {str(e)}"
+            return False, f"Validation error: {str(e)}"
     
-    def _validate_shell(self, file_path: str) -> Tuple[bool, Optional[str]]:
-        """Validate shell script syntax using bash -n."""
+    @staticmethod
+    def _cache_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+        """Cache key identifying the current version of a file (None if it is missing)."""
         try:
-            result = subprocess.run(
-                ['bash', '-n', file_path],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                return True, None
-            else:
-                return False, f"Shell syntax error: {result.stderr.strip()}"
-                
-        except subprocess.TimeoutExpired:
-            return False, "Shell validation timeout"
-        except FileNotFoundError:
-            # bash not available, skip validation
-            return True, None
-        except Exception as e:
-            return False, f"Shell validation error: {str(e)}"
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return file_path, stat.st_mtime_ns, stat.st_size
     
-    def _validate_powershell(self, file_path: str) -> Tuple[bool, Optional[str]]:
-        """Validate PowerShell script syntax."""
+    def _cache_get(self, key: Optional[Tuple[str, int, int]]) -> Optional[Tuple[bool, Optional[str]]]:
+        """Cached result for key, or None."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            result = self._validation_cache.get(key)
+            if result is not None:
+                self._validation_cache.move_to_end(key)
+        return result
+    
+    def _cache_put(self, key: Optional[Tuple[str, int, int]], result: Tuple[bool, Optional[str]]) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        if key is None:
+            return
+        with self._cache_lock:
+            self._validation_cache[key] = result
+            if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+    
+    def _load_cache(self) -> None:
+        """Load persisted results (a missing or corrupt cache file is ignored)."""
         try:
-            result = subprocess.run(
-                ['powershell', '-NoProfile', '-Command', f'Get-Command -Syntax (Get-Content "{file_path}" -Raw)'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            entries = json.loads(self._cache_file.read_bytes())
+            for file_path, mtime_ns, size, is_valid, error_msg in entries:
+                self._validation_cache[(file_path, mtime_ns, size)] = (is_valid, error_msg)
+        except (OSError, ValueError, TypeError):
+            self._validation_cache.clear()
+    
+    def _save_cache(self) -> None:
+        """Persist results when the validator was created with persistent=True."""
+        if self._cache_file is None:
+            return
+        entries = [[*key, *result] for key, result in self._validation_cache.items()]
+        self._cache_file.write_text(json.dumps(entries), encoding='utf-8')
+    
+    @staticmethod
+    def _scripts(file_paths: List[str], extension: str) -> List[str]:
+        """Existing files with the given extension (missing files are reported by validate_file)."""
+        if VALIDATORS[extension] is _validate_noop:
+            # Nothing to batch; validate_file accepts them without a subprocess
+            return []
+        return [
+            file_path for file_path in file_paths
+            if _extension(file_path) == extension and os.path.isfile(file_path)
+        ]
+    
+    def _validate_shell_batch(self, file_paths: List[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """Validate shell scripts with one bash invocation per SHELL_BATCH_SIZE files."""
+        import subprocess
+        results = {}
+        for start in range(0, len(file_paths), SHELL_BATCH_SIZE):
+            batch = file_paths[start:start + SHELL_BATCH_SIZE]
+            try:
+                result = subprocess.run(
+                    ['bash', '-c', _SHELL_BATCH_SCRIPT, 'bash', *batch],
+                    capture_output=True,
+                    timeout=10 * len(batch)
+                )
+            except subprocess.TimeoutExpired:
+                results.update(dict.fromkeys(batch, (False, "Shell validation timeout")))
+                continue
+            except FileNotFoundError:
+                # bash not available, skip validation
+                results.update(dict.fromkeys(batch, (True, None)))
+                continue
             
-            if result.returncode == 0:
-                return True, None
-            else:
-                return False, f"PowerShell syntax error: {result.stderr.strip()}"
-                
-        except subprocess.TimeoutExpired:
-            return False, "PowerShell validation timeout"
-        except FileNotFoundError:
-            # PowerShell not available, skip validation
-            return True, None
-        except Exception as e:
-            return False, f"PowerShell validation error: {str(e)}"
+            fields = result.stdout.decode('utf-8', errors='replace').split('\0')
+            failures = dict(zip(fields[0::2], fields[1::2]))
+            for file_path in batch:
+                if file_path in failures:
+                    results[file_path] = False, f"Shell syntax error: {failures[file_path].strip()}"
+                else:
+                    results[file_path] = True, None
+        
+        return results
 
 
 def main():
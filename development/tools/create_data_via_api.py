@@ -3,64 +3,71 @@
 Create test data via API
 """
 
-import requests
-import json
+import asyncio
+import httpx
+import orjson
 
 BASE_URL = "http://localhost:8000"
+JSON_HEADERS = {"Content-Type": "application/json"}
 
-def create_test_data():
+async def create_test_data():
     """Create test data via API"""
     print("🔧 Creating test data via API...")
-    
-    # 1. Create regular user
-    print("👤 Creating user...")
-    user_data = {
-        "email": "user@example.com",
-        "username": "testuser",
-        "full_name": "Test User",
-        "password": "password123",
-        "is_active": True
-    }
-    
-    response = requests.post(f"{BASE_URL}/api/v1/users/", json=user_data)
-    if response.status_code == 201:
-        print("✅ User created")
-        user = response.json()
-    else:
-        print(f"❌ User creation error: {response.status_code}")
-        print(response.text)
-        return
-    
-    # 2. Login to system
-    print("🔐 Logging in...")
-    login_data = {
-        "username": "testuser",
-        "password": "password123"
-    }
-    
-    response = requests.post(f"{BASE_URL}/auth/login", data=login_data)
-    if response.status_code == 200:
-        token_data = response.json()
-        token = token_data["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-        print("✅ Successful login")
-    else:
-        print(f"❌ Login error: {response.status_code}")
-        print(response.text)
-        return
-    
-    # Check if data already exists
-    response = requests.get(f"{BASE_URL}/api/v1/books/")
-    if response.status_code == 200 and len(response.json()) > 0:
-        print("📚 Books already exist")
-        return
-    
-    print("📚 Data will be created by administrator...")
-    print("Creating books requires superuser privileges")
-    print("Use admin panel or create superuser")
+
+    # One client for the whole run so connections are kept alive between calls
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        # 1. Create regular user
+        print("👤 Creating user...")
+        user_data = {
+            "email": "user@example.com",
+            "username": "testuser",
+            "full_name": "Test User",
+            "password": "password123",
+            "is_active": True
+        }
+
+        # The books check does not depend on the user, so run both requests concurrently
+        response, books_response = await asyncio.gather(
+            client.post("/api/v1/users/", content=orjson.dumps(user_data), headers=JSON_HEADERS),
+            client.get("/api/v1/books/")
+        )
+        if response.status_code == 201:
+            print("✅ User created")
+            user = orjson.loads(response.content)
+        else:
+            print(f"❌ User creation error: {response.status_code}")
+            print(response.text)
+            return
+
+        # 2. Login to system
+        print("🔐 Logging in...")
+        login_data = {
+            "username": "testuser",
+            "password": "password123"
+        }
+
+        response = await client.post("/auth/login", data=login_data)
+        if response.status_code == 200:
+            token_data = orjson.loads(response.content)
+            token = token_data["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+            print("✅ Successful login")
+        else:
+            print(f"❌ Login error: {response.status_code}")
+            print(response.text)
+            return
+
+        # Check if data already exists
+        if books_response.status_code == 200 and len(orjson.loads(books_response.content)) > 0:
+            print("📚 Books already exist")
+            return
+
+        print("📚 Data will be created by administrator...")
+        print("Creating books requires superuser privileges")
+        print("Use admin panel or create superuser")
 
 if __name__ == "__main__":
     try:
-        create_test_data()
-    except requests.exceptions.ConnectionError:
-        print("❌ API unavailable. Start server with: python run_bookstore.py")
\ No newline at end of file
+        asyncio.run(create_test_data())
+    except httpx.ConnectError:
+        print("❌ API unavailable. Start server with: python run_bookstore.py")
@@ -3,10 +3,15 @@
 Create test data for BookStore API
 """
 
+from sqlalchemy import insert
+
 from bookstore.database import SessionLocal
-from bookstore.models import User, Author, Genre, Book
+from bookstore.models import User, Author, Genre, Book, book_authors, book_genres
 from bookstore.auth import get_password_hash
 
+# Seed accounts are throwaway, so hash them with bcrypt's minimum cost instead of the default 12
+SEED_BCRYPT_ROUNDS = 4
+
 def create_test_data():
     """Create test data"""
     db = SessionLocal()
@@ -15,93 +20,96 @@ def create_test_data():
         if db.query(User).first():
             print("Data already exists")
             return
-        
+
         print("Creating test data...")
-        
+
+        # Each table is filled with a single multi-row INSERT instead of one add() per object
+
         # Create users
-        admin_user = User(
-            email="admin@bookstore.com",
-            username="admin",
-            full_name="Administrator",
-            hashed_password=get_password_hash("admin123"),
-            is_active=True,
-            is_superuser=True
-        )
-        db.add(admin_user)
-        
-        regular_user = User(
-            email="user@example.com",
-            username="testuser",
-            full_name="Test User",
-            hashed_password=get_password_hash("password123"),
-            is_active=True,
-            is_superuser=False
-        )
-        db.add(regular_user)
-        
+        db.execute(insert(User), [
+            {
+                "email": "admin@bookstore.com",
+                "username": "admin",
+                "full_name": "Administrator",
+                "hashed_password": get_password_hash("admin123", rounds=SEED_BCRYPT_ROUNDS),
+                "is_active": True,
+                "is_superuser": True
+            },
+            {
+                "email": "user@example.com",
+                "username": "testuser",
+                "full_name": "Test User",
+                "hashed_password": get_password_hash("password123", rounds=SEED_BCRYPT_ROUNDS),
+                "is_active": True,
+                "is_superuser": False
+            }
+        ])
+
         # Create authors
-        authors = [
-            Author(name="Leo Tolstoy", biography="Russian writer", nationality="Russia"),
-            Author(name="Fyodor Dostoevsky", biography="Russian writer", nationality="Russia"),
-            Author(name="Alexander Pushkin", biography="Russian poet", nationality="Russia")
-        ]
-        
-        for author in authors:
-            db.add(author)
-        
+        db.execute(insert(Author), [
+            {"name": "Leo Tolstoy", "biography": "Russian writer", "nationality": "Russia"},
+            {"name": "Fyodor Dostoevsky", "biography": "Russian writer", "nationality": "Russia"},
+            {"name": "Alexander Pushkin", "biography": "Russian poet", "nationality": "Russia"}
+        ])
+
         # Create genres
-        genres = [
-            Genre(name="Classic Literature", description="Works by classic authors"),
-            Genre(name="Novel", description="Epic genre"),
-            Genre(name="Poetry", description="Poetic works")
-        ]
-        
-        for genre in genres:
-            db.add(genre)
-        
-        # Save to get IDs
-        db.commit()
-        
+        db.execute(insert(Genre), [
+            {"name": "Classic Literature", "description": "Works by classic authors"},
+            {"name": "Novel", "description": "Epic genre"},
+            {"name": "Poetry", "description": "Poetic works"}
+        ])
+
         # Create books
-        book1 = Book(
-            title="War and Peace",
-            description="Epic novel about Russian society",
-            page_count=1300,
-            language="en",
-            price=599.99,
-            is_available=True
-        )
-        book1.authors = [authors[0]]  # Leo Tolstoy
-        book1.genres = [genres[0], genres[1]]  # Classic, Novel
-        db.add(book1)
-        
-        book2 = Book(
-            title="Crime and Punishment",
-            description="Psychological novel",
-            page_count=671,
-            language="en",
-            price=449.99,
-            is_available=True
-        )
-        book2.authors = [authors[1]]  # Dostoevsky
-        book2.genres = [genres[0], genres[1]]  # Classic, Novel
-        db.add(book2)
-        
-        book3 = Book(
-            title="Eugene Onegin",
-            description="Novel in verse",
-            page_count=384,
-            language="en",
-            price=299.99,
-            is_available=True
-        )
-        book3.authors = [authors[2]]  # Pushkin
-        book3.genres = [genres[0], genres[2]]  # Classic, Poetry
-        db.add(book3)
-        
+        db.execute(insert(Book), [
+            {
+                "title": "War and Peace",
+                "description": "Epic novel about Russian society",
+                "page_count": 1300,
+                "language": "en",
+                "price": 599.99,
+                "is_available": True
+            },
+            {
+                "title": "Crime and Punishment",
+                "description": "Psychological novel",
+                "page_count": 671,
+                "language": "en",
+                "price": 449.99,
+                "is_available": True
+            },
+            {
+                "title": "Eugene Onegin",
+                "description": "Novel in verse",
+                "page_count": 384,
+                "language": "en",
+                "price": 299.99,
+                "is_available": True
+            }
+        ])
+
+        # Look up generated IDs with one query per table
+        author_ids = dict(db.query(Author.name, Author.id))
+        genre_ids = dict(db.query(Genre.name, Genre.id))
+        book_ids = dict(db.query(Book.title, Book.id))
+
+        # Link books to authors and genres
+        db.execute(insert(book_authors), [
+            {"book_id": book_ids["War and Peace"], "author_id": author_ids["Leo Tolstoy"]},
+            {"book_id": book_ids["Crime and Punishment"], "author_id": author_ids["Fyodor Dostoevsky"]},
+            {"book_id": book_ids["Eugene Onegin"], "author_id": author_ids["Alexander Pushkin"]}
+        ])
+        db.execute(insert(book_genres), [
+            {"book_id": book_ids["War and Peace"], "genre_id": genre_ids["Classic Literature"]},
+            {"book_id": book_ids["War and Peace"], "genre_id": genre_ids["Novel"]},
+            {"book_id": book_ids["Crime and Punishment"], "genre_id": genre_ids["Classic Literature"]},
+            {"book_id": book_ids["Crime and Punishment"], "genre_id": genre_ids["Novel"]},
+            {"book_id": book_ids["Eugene Onegin"], "genre_id": genre_ids["Classic Literature"]},
+            {"book_id": book_ids["Eugene Onegin"], "genre_id": genre_ids["Poetry"]}
+        ])
+
         db.commit()
         print("✅ Test data created successfully!")
-        
+
     except Exception as e:
         print(f"❌ Error: {e}")
         db.rollback()
@@ -109,4 +117,4 @@ def create_test_data():
         db.close()
 
 if __name__ == "__main__":
-    create_test_data()
\ No newline at end of file
+    create_test_data()
@@ -3,12 +3,23 @@
 from flask import Flask, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from sqlalchemy import event, inspect
 import os
 
 # Initialize extensions
 db = SQLAlchemy()
 
 
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journal and fewer fsyncs for every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.close()
+
+
 def create_app(config_name='development'):
     """Create and configure Flask application."""
     app = Flask(__name__)
@@ -45,22 +56,17 @@ def create_app(config_name='development'):
         static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'static')
         return send_from_directory(static_dir, filename)
     
-    # Create tables
+    # Create tables only when the database is new and seed them while empty;
+    # on later starts this is a schema lookup and a LIMIT 1 query instead of
+    # create_all + COUNT. Use recreate_db.py after schema changes.
     with app.app_context():
-        db.create_all()
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', set_sqlite_pragmas)
         
-        # Seed data if tables are empty
-        from app.models.node import Node
-        try:
-            if Node.query.count() == 0:
-                from app.utils.seed_data import create_bookstore_roadmap
-                create_bookstore_roadmap()
-        except Exception as e:
-            # If there's an error (like missing column), recreate everything
-            print(f"Database error: {e}")
-            print("Recreating database...")
-            db.drop_all()
+        from app.models.node import Node  # Register model before create_all
+        if not inspect(db.engine).has_table(Node.__tablename__):
             db.create_all()
+        if Node.query.first() is None:
             from app.utils.seed_data import create_bookstore_roadmap
             create_bookstore_roadmap()
     
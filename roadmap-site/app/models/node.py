@@ -1,6 +1,7 @@
 """Node model for roadmap tree structure."""
 
 from app import db
+from sqlalchemy import text
 from sqlalchemy.orm import relationship, backref
 
 
@@ -20,7 +21,7 @@ class Node(db.Model):
     children = relationship(
         'Node',
         backref=backref('parent', remote_side=[id]),
-        lazy='dynamic',
+        lazy='selectin',
         cascade='all, delete-orphan'
     )
     
@@ -36,8 +37,12 @@ class Node(db.Model):
         """String representation of Node."""
         return f'<Node {self.id}: {self.title}>'
     
-    def to_dict(self, include_children=True):
-        """Convert node to dictionary with optional children."""
+    def to_dict(self, include_children=True, children_map=None):
+        """Convert node to dictionary with optional children.
+        
+        The whole subtree is loaded with one query (see get_children_map);
+        pass children_map to reuse an already loaded subtree.
+        """
         result = {
             'id': self.id,
             'title': self.title,
@@ -48,28 +53,69 @@ class Node(db.Model):
         }
         
         if include_children:
+            if children_map is None:
+                children_map = self.get_children_map()
             result['children'] = [
-                child.to_dict(include_children=True) 
-                for child in self.children.all()
+                child.to_dict(include_children=True, children_map=children_map)
+                for child in children_map.get(self.id, [])
             ]
         
         return result
     
+    @classmethod
+    def load_subtree(cls, root_id):
+        """Load a node and all its descendants with one recursive query."""
+        statement = text(
+            'WITH RECURSIVE subtree AS ('
+            ' SELECT * FROM nodes WHERE id = :root_id'
+            ' UNION ALL'
+            ' SELECT n.* FROM nodes n JOIN subtree s ON n.parent_id = s.id'
+            ') SELECT * FROM subtree'
+        )
+        nodes = db.session.query(cls).from_statement(statement).params(root_id=root_id).all()
+        return {node.id: node for node in nodes}
+    
+    def get_children_map(self):
+        """Map parent id -> list of children for this node's whole subtree."""
+        children_map = {}
+        for node in sorted(self.load_subtree(self.id).values(), key=lambda n: n.id):
+            children_map.setdefault(node.parent_id, []).append(node)
+        return children_map
+    
     @classmethod
     def get_root_nodes(cls):
         """Get all root nodes (nodes without parent)."""
         return cls.query.filter_by(parent_id=None).all()
     
     def get_all_descendants(self):
-        """Get all descendants of this node recursively."""
+        """Get all descendants of this node (depth-first, parents before children)."""
+        children_map = self.get_children_map()
         descendants = []
-        for child in self.children:
-            descendants.append(child)
-            descendants.extend(child.get_all_descendants())
+        # Iterative walk over the preloaded subtree: no recursion, no sublist copies
+        stack = list(reversed(children_map.get(self.id, [])))
+        while stack:
+            node = stack.pop()
+            descendants.append(node)
+            stack.extend(reversed(children_map.get(node.id, [])))
         return descendants
     
+    @classmethod
+    def depth_of(cls, node_id):
+        """Get depth of a node by id with one recursive query up to the root."""
+        return db.session.execute(
+            text(
+                'WITH RECURSIVE ancestors(id, parent_id, depth) AS ('
+                ' SELECT id, parent_id, 0 FROM nodes WHERE id = :node_id'
+                ' UNION ALL'
+                ' SELECT n.id, n.parent_id, a.depth + 1'
+                ' FROM nodes n JOIN ancestors a ON n.id = a.parent_id'
+                ') SELECT MAX(depth) FROM ancestors'
+            ),
+            {'node_id': node_id}
+        ).scalar() or 0
+    
     def get_depth(self):
         """Get the depth of this node in the tree (root = 0)."""
         if self.parent_id is None:
             return 0
-        return self.parent.get_depth() + 1
\ No newline at end of file
+        return self.depth_of(self.id)
\ No newline at end of file
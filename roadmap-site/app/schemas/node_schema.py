@@ -20,8 +20,12 @@ class NodeSchema(Schema):
             return [self._dump_single_node(node) for node in obj]
         return self._dump_single_node(obj)
     
-    def _dump_single_node(self, node):
+    def _dump_single_node(self, node, children_map=None):
         """Dump a single node with its children recursively."""
+        # Load the whole subtree once instead of querying children per node
+        if children_map is None:
+            children_map = node.get_children_map()
+        
         result = {
             'id': node.id,
             'title': node.title,
@@ -33,8 +37,8 @@ class NodeSchema(Schema):
         }
         
         # Recursively add children
-        for child in node.children.all():
-            result['children'].append(self._dump_single_node(child))
+        for child in children_map.get(node.id, []):
+            result['children'].append(self._dump_single_node(child, children_map))
         
         return result
 
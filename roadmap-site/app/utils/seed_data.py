@@ -10,6 +10,10 @@ def create_bookstore_roadmap():
     # GitHub repository base URL
     GITHUB_BASE = "https://github.com/f1sherFM/bookstore-api-course"
     
+    # Leaf steps are collected here and written with one multi-row INSERT at the end;
+    # only section nodes are flushed individually because their IDs are needed as parents
+    leaf_rows = []
+    
     # Root level - BookStore API Learning Roadmap
     bookstore_root = Node(
         title="📚 BookStore API Learning Roadmap",
@@ -41,9 +45,10 @@ def create_bookstore_roadmap():
         ("Get Books List", "Try /api/v1/books/ endpoint", "basic", f"{GITHUB_BASE}/blob/main/bookstore/routers/books.py")
     ]
     
-    for title, desc, node_type, github_url in quick_steps:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=quick_explorer.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': quick_explorer.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in quick_steps
+    )
     
     # 2. API User (30 minutes)
     api_user = Node(
@@ -74,9 +79,10 @@ def create_bookstore_roadmap():
         ("Refresh Token", "POST /auth/refresh", "basic", f"{GITHUB_BASE}/blob/main/bookstore/auth.py")
     ]
     
-    for title, desc, node_type, github_url in auth_steps:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=auth_flow.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': auth_flow.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in auth_steps
+    )
     
     # Core Operations
     core_ops = Node(
@@ -97,9 +103,10 @@ def create_bookstore_roadmap():
         ("Write Book Review", "POST /api/v1/books/{{id}}/reviews", "basic", f"{GITHUB_BASE}/blob/main/bookstore/routers/reviews.py")
     ]
     
-    for title, desc, node_type, github_url in core_steps:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=core_ops.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': core_ops.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in core_steps
+    )
     
     # 3. Developer (2 hours)
     developer = Node(
@@ -132,9 +139,10 @@ def create_bookstore_roadmap():
         ("Database Configuration", "Connection and session management", "intermediate", f"{GITHUB_BASE}/blob/main/bookstore/database.py")
     ]
     
-    for title, desc, node_type, github_url in structure_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=code_structure.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': code_structure.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in structure_items
+    )
     
     # Development Workflow
     dev_workflow = Node(
@@ -155,9 +163,10 @@ def create_bookstore_roadmap():
         ("Database Migrations", "Alembic migration system", "intermediate", f"{GITHUB_BASE}/tree/main/alembic")
     ]
     
-    for title, desc, node_type, github_url in workflow_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=dev_workflow.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': dev_workflow.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in workflow_items
+    )
     
     # Testing Deep Dive
     testing_dive = Node(
@@ -179,9 +188,10 @@ def create_bookstore_roadmap():
         ("Test Configuration", "Pytest setup and fixtures", "intermediate", f"{GITHUB_BASE}/blob/main/tests/conftest.py")
     ]
     
-    for title, desc, node_type, github_url in testing_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=testing_dive.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': testing_dive.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in testing_items
+    )
     
     # 4. Production User (1 hour)
     production_user = Node(
@@ -212,9 +222,10 @@ def create_bookstore_roadmap():
         ("Multi-stage Dockerfile", "Optimized container builds", "intermediate", f"{GITHUB_BASE}/blob/main/deployment/docker/Dockerfile")
     ]
     
-    for title, desc, node_type, github_url in docker_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=docker_deploy.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': docker_deploy.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in docker_items
+    )
     
     # Monitoring Setup
     monitoring = Node(
@@ -234,9 +245,10 @@ def create_bookstore_roadmap():
         ("Health Check Endpoints", "Service status monitoring", "intermediate", f"{GITHUB_BASE}/blob/main/development/scripts/production-health-check.sh")
     ]
     
-    for title, desc, node_type, github_url in monitoring_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=monitoring.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': monitoring.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in monitoring_items
+    )
     
     # 5. DevOps Engineer (3 hours)
     devops_engineer = Node(
@@ -267,9 +279,10 @@ def create_bookstore_roadmap():
         ("Registry Management", "GitHub Container Registry", "advanced", f"{GITHUB_BASE}/blob/main/.github/workflows/ci.yml")
     ]
     
-    for title, desc, node_type, github_url in container_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=containerization.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': containerization.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in container_items
+    )
     
     # Kubernetes Deployment
     k8s_deploy = Node(
@@ -289,9 +302,10 @@ def create_bookstore_roadmap():
         ("Persistent Storage", "Database and cache persistence", "advanced", f"{GITHUB_BASE}/blob/main/deployment/k8s/postgresql.yaml")
     ]
     
-    for title, desc, node_type, github_url in k8s_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=k8s_deploy.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': k8s_deploy.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in k8s_items
+    )
     
     # CI/CD Pipeline
     cicd_pipeline = Node(
@@ -311,9 +325,10 @@ def create_bookstore_roadmap():
         ("Multi-environment Deployment", "Staging and production", "advanced", f"{GITHUB_BASE}/blob/main/.github/workflows/performance.yml")
     ]
     
-    for title, desc, node_type, github_url in cicd_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=cicd_pipeline.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': cicd_pipeline.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in cicd_items
+    )
     
     # 6. Learning Path (Ongoing)
     learning_path = Node(
@@ -345,9 +360,10 @@ def create_bookstore_roadmap():
         ("Async Programming", "Async/await patterns", "advanced", f"{GITHUB_BASE}/blob/main/bookstore/main.py")
     ]
     
-    for title, desc, node_type, github_url in python_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=python_fundamentals.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': python_fundamentals.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in python_items
+    )
     
     # Testing Methodologies
     testing_methods = Node(
@@ -368,9 +384,10 @@ def create_bookstore_roadmap():
         ("Test Factories", "Data generation patterns", "intermediate", f"{GITHUB_BASE}/blob/main/tests/factories.py")
     ]
     
-    for title, desc, node_type, github_url in testing_method_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=testing_methods.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': testing_methods.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in testing_method_items
+    )
     
     # DevOps & Infrastructure
     devops_infra = Node(
@@ -391,9 +408,10 @@ def create_bookstore_roadmap():
         ("Security Practices", "Application security patterns", "advanced", f"{GITHUB_BASE}/blob/main/bookstore/auth.py")
     ]
     
-    for title, desc, node_type, github_url in devops_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=devops_infra.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': devops_infra.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in devops_items
+    )
     
     # Production Readiness
     production_ready = Node(
@@ -414,10 +432,12 @@ def create_bookstore_roadmap():
         ("Incident Response", "Monitoring and alerting", "advanced", f"{GITHUB_BASE}/tree/main/deployment/monitoring")
     ]
     
-    for title, desc, node_type, github_url in production_items:
-        node = Node(title=title, description=desc, node_type=node_type, parent_id=production_ready.id, github_url=github_url)
-        db.session.add(node)
+    leaf_rows.extend(
+        {'title': title, 'description': desc, 'node_type': node_type, 'parent_id': production_ready.id, 'github_url': github_url}
+        for title, desc, node_type, github_url in production_items
+    )
     
-    # Commit all changes
+    # Insert all leaf steps at once and commit all changes
+    db.session.execute(Node.__table__.insert(), leaf_rows)
     db.session.commit()
     print("BookStore API roadmap seed data created successfully!")
\ No newline at end of file
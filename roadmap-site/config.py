@@ -1,6 +1,7 @@
 """Configuration settings for Flask application."""
 
 import os
+from types import MappingProxyType
 
 
 class Config:
@@ -31,9 +32,9 @@ class TestingConfig(Config):
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
 
 
-config = {
+config = MappingProxyType({
     'development': DevelopmentConfig,
     'production': ProductionConfig,
     'testing': TestingConfig,
     'default': DevelopmentConfig
-}
\ No newline at end of file
+})
@@ -1,7 +1,7 @@
 """Script to recreate database with new schema."""
 
 import os
-from app import create_app, db
+from app import create_app
 
 # Remove old database files
 for db_file in ['roadmap.db', 'roadmap_dev.db']:
@@ -9,15 +9,9 @@ for db_file in ['roadmap.db', 'roadmap_dev.db']:
         os.remove(db_file)
         print(f"Removed {db_file}")
 
-# Create new database
+# Create new database (create_app creates tables and seeds data when they are missing)
 app = create_app('development')
-with app.app_context():
-    db.create_all()
-    print("Database tables created successfully!")
-    
-    # Seed data
-    from app.utils.seed_data import create_python_roadmap
-    create_python_roadmap()
-    print("Seed data added successfully!")
+print("Database tables created successfully!")
+print("Seed data added successfully!")
 
 print("Database recreation completed!")
\ No newline at end of file
@@ -1,8 +1,19 @@
 """Main application entry point."""
 
-from app import create_app
 
-app = create_app('development')
+def __getattr__(name):
+    """Build the app on first access to ``run.app`` (e.g. from a WSGI server)."""
+    if name == 'app':
+        from app import create_app
+        
+        global app
+        app = create_app('development')
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == '__main__':
+    from app import create_app
+    
+    app = create_app('development')
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -4,39 +4,42 @@ Pytest configuration and fixtures
 
 import pytest
 import asyncio
+import functools
+from types import SimpleNamespace
 from typing import Generator, AsyncGenerator
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from httpx import AsyncClient
+from sqlalchemy.pool import StaticPool
+from httpx import ASGITransport, AsyncClient
 
 from bookstore.main import app
 from bookstore.database import get_db, Base
 from bookstore.models import User, Author, Genre, Book
 from bookstore.auth import get_password_hash, create_access_token
 
-# Test database in memory
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Test database in memory (StaticPool keeps the single connection, and so the data, alive)
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
 )
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def override_get_db():
-    """Override DB dependency for tests"""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+# pysqlite manages transactions itself and breaks SAVEPOINT;
+# let SQLAlchemy emit BEGIN instead
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
 
-# Override dependency
-app.dependency_overrides[get_db] = override_get_db
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 @pytest.fixture(scope="session")
@@ -47,64 +50,122 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def database_schema():
+    """Create the schema once for the whole test session"""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
 @pytest.fixture(scope="function")
 def db_session():
-    """Create test DB session for each test"""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    """Create test DB session for each test
+    
+    The test runs inside an outer transaction that is rolled back afterwards;
+    commits made by the test (or the API) only release a SAVEPOINT.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection)
+    db.begin_nested()
+    
+    @event.listens_for(db, "after_transaction_end")
+    def restart_savepoint(session, trans):
+        if trans.nested and not trans._parent.nested:
+            # Expire state the way a top-level commit would
+            session.expire_all()
+            session.begin_nested()
+    
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        if transaction.is_active:
+            transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture(scope="function")
-def client(db_session) -> Generator[TestClient, None, None]:
-    """FastAPI test client"""
+@pytest.fixture(autouse=True)
+def override_get_db(db_session):
+    """Serve API requests made during a test from that test's session"""
+    app.dependency_overrides[get_db] = lambda: db_session
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    """FastAPI test client (startup/shutdown run once per session)
+    
+    Cookies persist across tests; create a separate TestClient(app)
+    in tests that depend on a clean cookie jar.
+    """
     with TestClient(app) as test_client:
         yield test_client
 
 
-@pytest.fixture(scope="function")
-async def async_client(db_session) -> AsyncGenerator[AsyncClient, None]:
-    """Async test client"""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+@pytest.fixture(scope="session")
+async def async_client() -> AsyncGenerator[AsyncClient, None]:
+    """Async test client shared by the whole session"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_password_hash(password: str) -> str:
+    """Hash of a fixture password, computed once per session (hashing is slow on purpose)"""
+    return get_password_hash(password)
+
+
 @pytest.fixture
-def test_user(db_session) -> User:
-    """Create test user"""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-        hashed_password=get_password_hash("testpass123"),
-        is_active=True,
-        is_superuser=False
+def seed(db_session) -> SimpleNamespace:
+    """Create the test user, superuser, author and genre in one transaction"""
+    seed = SimpleNamespace(
+        user=User(
+            email="test@example.com",
+            username="testuser",
+            full_name="Test User",
+            hashed_password=_cached_password_hash("testpass123"),
+            is_active=True,
+            is_superuser=False
+        ),
+        superuser=User(
+            email="admin@example.com",
+            username="admin",
+            full_name="Admin User",
+            hashed_password=_cached_password_hash("adminpass123"),
+            is_active=True,
+            is_superuser=True
+        ),
+        author=Author(
+            name="Test Author",
+            biography="Test biography",
+            nationality="Test Country"
+        ),
+        genre=Genre(
+            name="Test Genre",
+            description="Test genre description"
+        )
     )
-    db_session.add(user)
+    objects = [seed.user, seed.superuser, seed.author, seed.genre]
+    db_session.add_all(objects)
     db_session.commit()
-    db_session.refresh(user)
-    return user
+    for obj in objects:
+        db_session.refresh(obj)
+    return seed
 
 
 @pytest.fixture
-def test_superuser(db_session) -> User:
-    """Create test superuser"""
-    user = User(
-        email="admin@example.com",
-        username="admin",
-        full_name="Admin User",
-        hashed_password=get_password_hash("adminpass123"),
-        is_active=True,
-        is_superuser=True
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+def test_user(seed) -> User:
+    """Test user"""
+    return seed.user
+
+
+@pytest.fixture
+def test_superuser(seed) -> User:
+    """Test superuser"""
+    return seed.superuser
 
 
 @pytest.fixture
@@ -132,30 +193,15 @@ def admin_headers(admin_token) -> dict:
 
 
 @pytest.fixture
-def test_author(db_session) -> Author:
-    """Create test author"""
-    author = Author(
-        name="Test Author",
-        biography="Test biography",
-        nationality="Test Country"
-    )
-    db_session.add(author)
-    db_session.commit()
-    db_session.refresh(author)
-    return author
+def test_author(seed) -> Author:
+    """Test author"""
+    return seed.author
 
 
 @pytest.fixture
-def test_genre(db_session) -> Genre:
-    """Create test genre"""
-    genre = Genre(
-        name="Test Genre",
-        description="Test genre description"
-    )
-    db_session.add(genre)
-    db_session.commit()
-    db_session.refresh(genre)
-    return genre
+def test_genre(seed) -> Genre:
+    """Test genre"""
+    return seed.genre
 
 
 @pytest.fixture
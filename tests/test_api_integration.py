@@ -4,6 +4,7 @@ API integration tests
 
 import pytest
 from fastapi import status
+from bookstore.schemas import Book as BookSchema, BookColumnar
 
 
 class TestAuthenticationAPI:
@@ -135,6 +136,31 @@ class TestBooksAPI:
         assert data[0]["title"] == test_book.title
         assert data[0]["price"] == test_book.price
     
+    def test_get_books_columnar(self, client, test_book):
+        """Test getting book list in columnar format"""
+        response = client.get("/api/v1/books/?format=columnar")
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["ids"] == [test_book.id]
+        assert data["titles"] == [test_book.title]
+        assert data["prices"] == [test_book.price]
+    
+    def test_get_books_matches_schema(self, client, test_book):
+        """Test the pre-serialized book list matches Book schema validation"""
+        response = client.get("/api/v1/books/")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [BookSchema.model_validate(test_book).model_dump(mode="json")]
+    
+    def test_get_books_columnar_matches_schema(self, client, test_book):
+        """Test the columnar book list matches BookColumnar validation"""
+        response = client.get("/api/v1/books/?format=columnar")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert BookColumnar.model_validate(response.json()).ids == [test_book.id]
+    
     def test_get_book_by_id(self, client, test_book):
         """Test getting book by ID"""
         response = client.get(f"/api/v1/books/{test_book.id}")
@@ -0,0 +1,94 @@
+"""
+Tests for the learning examples in development/examples
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "development" / "examples"))
+
+from decorators_advanced import cache, combined, log_calls
+
+
+class TestCache:
+    """cache decorator tests"""
+    
+    def test_positional_tuple_and_keyword_keys_differ(self):
+        """Test f(('a', 2)) and f(a=2) get separate cache entries"""
+        @cache()
+        def describe(*args, **kwargs):
+            return args, kwargs
+        
+        assert describe(("a", 2)) == ((("a", 2),), {})
+        assert describe(a=2) == ((), {"a": 2})
+        assert describe.cache_info().misses == 2
+    
+    def test_unhashable_arguments_cached(self):
+        """Test unhashable arguments fall back to a string key"""
+        calls = []
+        
+        @cache()
+        def total(values):
+            calls.append(values)
+            return sum(values)
+        
+        assert total([1, 2]) == 3
+        assert total([1, 2]) == 3
+        assert len(calls) == 1
+
+
+class TestCombined:
+    """combined decorator tests"""
+    
+    def test_cache_hit_skips_call(self):
+        """Test repeated calls are served from the cache"""
+        calls = []
+        
+        @combined(timed=False, logged=False)
+        def square(x):
+            calls.append(x)
+            return x * x
+        
+        assert square(3) == square(3) == 9
+        assert calls == [3]
+        assert square.cache_info().hits == 1
+    
+    def test_exception_not_logged_when_logged_is_false(self, caplog):
+        """Test exceptions propagate without an error log when logged=False"""
+        @combined(timed=False, logged=False)
+        def fail():
+            raise ValueError("boom")
+        
+        with caplog.at_level(logging.ERROR), pytest.raises(ValueError):
+            fail()
+        
+        assert not caplog.records
+    
+    def test_exception_logged_when_logged(self, caplog):
+        """Test exceptions are logged at ERROR when logged=True"""
+        @combined(timed=False)
+        def fail():
+            raise ValueError("boom")
+        
+        with caplog.at_level(logging.ERROR), pytest.raises(ValueError):
+            fail()
+        
+        assert "boom" in caplog.text
+
+
+class TestLogCalls:
+    """log_calls decorator tests"""
+    
+    def test_exception_logged_when_level_disabled(self, caplog):
+        """Test exceptions are logged at ERROR even if the call level is off"""
+        @log_calls(level=logging.DEBUG)
+        def fail():
+            raise ValueError("boom")
+        
+        with caplog.at_level(logging.INFO), pytest.raises(ValueError):
+            fail()
+        
+        assert [record.levelno for record in caplog.records] == [logging.ERROR]
@@ -0,0 +1,207 @@
+"""
+Tests for the localization scripts in development/scripts
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "development" / "scripts"))
+
+from language_detector import MAX_SAMPLE_CHARS, LanguageDetector
+from localization_backup import iter_files
+from localization_utils import LocalizationInfrastructure
+from syntax_validator import SyntaxValidator
+
+
+@pytest.fixture
+def infra(tmp_path) -> LocalizationInfrastructure:
+    """Infrastructure writing its backups into a temporary directory"""
+    return LocalizationInfrastructure(str(tmp_path / "backups"))
+
+
+@pytest.fixture
+def text_files(tmp_path) -> list:
+    """Five small text files"""
+    paths = []
+    for name in "abcde":
+        path = tmp_path / f"{name}.txt"
+        path.write_text("Some English text for the detector\n", encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def rewrite_keeping_stat(path: Path, text: str) -> None:
+    """Replace a file's content without changing its size or mtime"""
+    stat = path.stat()
+    path.write_text(text, encoding="utf-8")
+    assert path.stat().st_size == stat.st_size
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+class TestIterFiles:
+    """iter_files tests"""
+    
+    def test_extensions_match_whole_suffix(self, tmp_path):
+        """Test extensions match the file suffix, with or without the leading dot"""
+        for name in ("app.py", "happy", "notes.md", "archive.tar.gz", "skip.txt"):
+            (tmp_path / name).write_text("", encoding="utf-8")
+        
+        found = {Path(path).name for path in iter_files(str(tmp_path), ["py", ".md", "gz"])}
+        
+        assert found == {"app.py", "notes.md", "archive.tar.gz"}
+    
+    def test_skipped_dirs_not_descended(self, tmp_path):
+        """Test files in skipped directories are not yielded"""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "src" / "a.py").write_text("", encoding="utf-8")
+        (tmp_path / "node_modules" / "b.py").write_text("", encoding="utf-8")
+        
+        found = list(iter_files(str(tmp_path), [".py"], frozenset({"node_modules"})))
+        
+        assert found == [str(tmp_path / "src" / "a.py")]
+
+
+class TestSafeModifyFiles:
+    """safe_modify_files tests"""
+    
+    @staticmethod
+    def modifier(fail_on: str, modified: list):
+        """Modification function that records its calls and fails for one file"""
+        lock = threading.Lock()
+        
+        def modify(file_path):
+            with lock:
+                modified.append(file_path)
+            if file_path == fail_on:
+                raise RuntimeError("modification failed")
+            Path(file_path).write_text("Changed English text\n", encoding="utf-8")
+        
+        return modify
+    
+    def test_sequential_by_default(self, infra, text_files):
+        """Test files run one by one and stop at the first failure"""
+        modified = []
+        results = infra.safe_modify_files(text_files, self.modifier(text_files[1], modified), fail_fast=True)
+        
+        assert [r["file"] for r in results] == text_files[:2]
+        assert [r["success"] for r in results] == [True, False]
+        assert modified == text_files[:2]
+    
+    def test_fail_fast_reports_started_files(self, infra, text_files):
+        """Test every file touched concurrently is reported after an early failure"""
+        modified = []
+        results = infra.safe_modify_files(
+            text_files, self.modifier(text_files[0], modified), fail_fast=True, max_workers=4
+        )
+        reported = [r["file"] for r in results]
+        
+        assert reported[0] == text_files[0]
+        assert not results[0]["success"]
+        assert sorted(reported) == sorted(modified)
+        assert reported == [path for path in text_files if path in reported]
+    
+    def test_without_fail_fast_all_files_reported(self, infra, text_files):
+        """Test all files are processed when fail_fast is off"""
+        modified = []
+        results = infra.safe_modify_files(text_files, self.modifier(text_files[1], modified), max_workers=4)
+        
+        assert [r["file"] for r in results] == text_files
+        assert [r["success"] for r in results] == [True, False, True, True, True]
+
+
+    def test_language_rechecked_after_same_size_rewrite(self, infra, tmp_path):
+        """Test the post-check sees a rewrite that keeps mtime and size"""
+        path = tmp_path / "notes.md"
+        path.write_text("Это текст\n", encoding="utf-8")
+        
+        results = infra.safe_modify_files(
+            [str(path)], lambda file_path: rewrite_keeping_stat(Path(file_path), "This is the text \n")
+        )
+        
+        assert results[0]["language_before"] == "russian"
+        assert results[0]["language_after"] == "english"
+
+
+class TestLanguageDetector:
+    """LanguageDetector file analysis tests"""
+    
+    def test_cyrillic_after_sample_is_detected(self, tmp_path):
+        """Test a Russian comment past the analyzed sample still counts"""
+        path = tmp_path / "big.py"
+        code = "".join(f"value_{i} = compute({i})\n" for i in range(MAX_SAMPLE_CHARS // 10))
+        path.write_text(code + "# Это комментарий на русском языке\n", encoding="utf-8")
+        
+        result = LanguageDetector().detect_file_language(str(path))
+        
+        assert result["language"] == "russian"
+        assert result["total_length"] == len(path.read_text(encoding="utf-8"))
+    
+    def test_refresh_bypasses_cache(self, tmp_path):
+        """Test refresh re-analyzes a file rewritten with the same mtime and size"""
+        path = tmp_path / "notes.md"
+        path.write_text("Это текст\n", encoding="utf-8")
+        detector = LanguageDetector()
+        assert detector.detect_file_language(str(path))["language"] == "russian"
+        
+        rewrite_keeping_stat(path, "This is the text \n")
+        
+        assert detector.detect_file_language(str(path))["language"] == "russian"
+        assert detector.detect_file_language(str(path), refresh=True)["language"] == "english"
+    
+    def test_file_without_text_is_unknown(self, tmp_path):
+        """Test a file with no comments or prose isn't counted as English"""
+        path = tmp_path / "deployment.yaml"
+        path.write_text("apiVersion: v1\nkind: Service\nmetadata:\n  name: api\n", encoding="utf-8")
+        
+        result = LanguageDetector().detect_file_language(str(path))
+        
+        assert result["language"] == "unknown"
+        assert result["text_length"] == 0
+
+
+class TestValidateFilesParallel:
+    """SyntaxValidator.validate_files_parallel tests"""
+    
+    @staticmethod
+    def json_files(tmp_path, contents: str) -> list:
+        """One JSON file per character: 'v' valid, 'x' invalid"""
+        paths = []
+        for index, kind in enumerate(contents):
+            path = tmp_path / f"{index}.json"
+            path.write_text('{"ok": true}' if kind == "v" else '{"ok": ', encoding="utf-8")
+            paths.append(str(path))
+        return paths
+    
+    def test_fail_fast_stops_at_first_invalid_in_input_order(self, tmp_path):
+        """Test fail_fast keeps files up to the first invalid one in input order"""
+        paths = self.json_files(tmp_path, "vvxvxv")
+        
+        results = SyntaxValidator().validate_files_parallel(paths, workers=2, fail_fast=True)
+        
+        assert list(results) == paths[:3]
+        assert [is_valid for is_valid, _ in results.values()] == [True, True, False]
+    
+    def test_fail_fast_validates_uncached_files_before_cached_failure(self, tmp_path):
+        """Test a cached invalid file doesn't drop uncached files before it"""
+        paths = self.json_files(tmp_path, "vvxv")
+        validator = SyntaxValidator()
+        validator.validate_file(paths[2])
+        
+        results = validator.validate_files_parallel(paths, workers=2, fail_fast=True)
+        
+        assert list(results) == paths[:3]
+        assert [is_valid for is_valid, _ in results.values()] == [True, True, False]
+    
+    def test_all_files_without_fail_fast(self, tmp_path):
+        """Test every file is reported when fail_fast is off"""
+        paths = self.json_files(tmp_path, "vxvx")
+        
+        results = SyntaxValidator().validate_files_parallel(paths, workers=2)
+        
+        assert list(results) == paths
+        assert [is_valid for is_valid, _ in results.values()] == [True, False, True, False]
@@ -2,13 +2,16 @@
 Basic unit tests
 """
 
+import json
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from bookstore.auth import (
     get_password_hash, verify_password, create_access_token,
     get_user_by_username, authenticate_user
 )
 from bookstore.models import User, Book, Author, Genre
+from pydantic import ValidationError
+from bookstore.schemas import BOOK_LIST_ADAPTER, BookCreate, BookUpdate, PaginatedResponse, dump_list_json, to_epoch
 
 
 class TestPasswordHashing:
@@ -35,6 +38,13 @@ class TestPasswordHashing:
         """Test empty password"""
         with pytest.raises(Exception):
             get_password_hash("")
+    
+    def test_password_hashing_custom_rounds(self):
+        """Test hashing with a lowered cost factor"""
+        hashed = get_password_hash("testpassword123", rounds=4)
+        
+        assert hashed.startswith("$2b$04$")
+        assert verify_password("testpassword123", hashed)
 
 
 class TestJWTTokens:
@@ -184,4 +194,79 @@ class TestValidation:
         db_session.add(duplicate_genre)
         
         with pytest.raises(Exception):  # Should be uniqueness error
-            db_session.commit()
\ No newline at end of file
+            db_session.commit()
+
+
+class TestBookSchemas:
+    """Book schema validation tests"""
+    
+    def test_book_language_default(self):
+        """Test default book language"""
+        book = BookCreate(title="Test", author_ids=[1], genre_ids=[1])
+        assert book.language == "ru"
+    
+    def test_book_language_unsupported(self):
+        """Test that unsupported language codes are rejected"""
+        with pytest.raises(ValidationError):
+            BookCreate(title="Test", language="xx", author_ids=[1], genre_ids=[1])
+        
+        with pytest.raises(ValidationError):
+            BookUpdate(language="english")
+    
+    def test_stored_language_outside_set_serialized(self, db_session, test_book):
+        """Test responses keep stored language codes outside the input set"""
+        test_book.language = "uk"
+        data = json.loads(dump_list_json(BOOK_LIST_ADAPTER, [test_book]))
+        
+        assert data[0]["language"] == "uk"
+
+
+class TestPaginatedResponse:
+    """Paginated response schema tests"""
+    
+    def test_pages_computed(self):
+        """Test pages is derived from total and size"""
+        assert PaginatedResponse(items=[], total=45, page=1, size=20).pages == 3
+        assert PaginatedResponse(items=[], total=40, page=1, size=20).pages == 2
+        assert PaginatedResponse(items=[], total=0, page=1, size=20).pages == 0
+    
+    def test_pages_in_dump(self):
+        """Test pages is included in serialized output"""
+        data = PaginatedResponse(items=[], total=5, page=1, size=2).model_dump()
+        
+        assert data["pages"] == 3
+    
+    def test_zero_size_rejected(self):
+        """Test a zero page size fails validation instead of dividing by zero"""
+        with pytest.raises(ValidationError):
+            PaginatedResponse(items=[], total=5, page=1, size=0)
+
+
+class TestSchemaAdapters:
+    """Prebuilt schema adapter tests"""
+    
+    def test_book_list_adapter_empty(self):
+        """Test serializing an empty book list"""
+        assert dump_list_json(BOOK_LIST_ADAPTER, []) == b"[]"
+    
+    def test_book_list_adapter_from_orm(self, db_session, test_book):
+        """Test serializing ORM books through the list adapter"""
+        data = json.loads(dump_list_json(BOOK_LIST_ADAPTER, [test_book]))
+        
+        assert len(data) == 1
+        assert data[0]["title"] == test_book.title
+        assert data[0]["authors"][0]["name"] == test_book.authors[0].name
+    
+    def test_timestamps_serialized_as_epoch(self, db_session, test_book):
+        """Test timestamps are sent as Unix seconds"""
+        test_book.created_at = datetime(2024, 1, 1)
+        data = json.loads(dump_list_json(BOOK_LIST_ADAPTER, [test_book]))
+        
+        assert data[0]["created_at"] == 1704067200
+        assert isinstance(data[0]["genres"][0]["created_at"], int)
+    
+    def test_naive_datetime_read_as_utc(self):
+        """Test naive datetimes convert the same regardless of server timezone"""
+        assert to_epoch(datetime(2024, 1, 1)) == 1704067200
+        assert to_epoch(datetime(2024, 1, 1, 3, tzinfo=timezone(timedelta(hours=3)))) == 1704067200
+        assert to_epoch(None) is None